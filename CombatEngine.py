@@ -8,20 +8,92 @@ replaces the former ``CombatEngine`` implementations spread across
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
-from typing import Dict, List, Tuple, Any
+from typing import Any, Dict, List, Tuple
 
-from data_layer.CardEntities import Card
-from game_core.GameState import GameState
+from data_layer.CardEntities import (
+    Card,
+    FLAG_DEATHTOUCH,
+    FLAG_HASTE,
+    FLAG_TRAMPLE,
+)
+from game_core.GameState import GameState, Phase
 from game_core.Player import Player
 
+# Interned combat-state literals shared by every declare/assign call.  Zone
+# values can originate from deserialized data, so comparisons stay ``==``
+# (equal interned strings still short-circuit on the pointer check); the
+# status writes reuse one shared object instead of allocating per creature.
+ZONE_BATTLEFIELD = sys.intern("battlefield")
+STATUS_ATTACKING = sys.intern("attacking")
+STATUS_BLOCKING = sys.intern("blocking")
+
+# Attack legality failure bits, ordered to match the original guard chain.
+_ATK_WRONG_ZONE = 1
+_ATK_WRONG_CONTROLLER = 2
+_ATK_NOT_CREATURE = 4
+_ATK_TAPPED = 8
+_ATK_SICK = 16
+
 
 @dataclass
 class CombatEngine:
-    """Handle combat flow according to MTG rules 506–510."""
+    """Handle combat flow according to MTG rules 506–510.
+
+    Combat participants are stored structure-of-arrays style: every card
+    touching combat is registered once in ``cards`` and referenced by its
+    integer ``_combat_id`` afterwards.  ``attacker_ids``, ``defenders`` and
+    ``blockers_of`` are parallel columns indexed by attacker slot, so damage
+    assignment walks plain integer indices instead of hashing ``Card``
+    instances or scanning a blocker-keyed dict.
+    """
+
+    #: Registry of every combat participant; ``_combat_id`` indexes into it.
+    cards: List[Card] = field(default_factory=list)
+    #: Per attacker slot: combat id of the attacking creature.
+    attacker_ids: List[int] = field(default_factory=list)
+    #: Per attacker slot: the player or planeswalker being attacked.
+    defenders: List[Any] = field(default_factory=list)
+    #: Per attacker slot: combat ids of the creatures blocking it.
+    blockers_of: List[List[int]] = field(default_factory=list)
+
+    #: When False (e.g. AI rollouts) no log strings are formatted at all;
+    #: the combat methods return empty lists.
+    log_enabled: bool = True
+
+    # ------------------------------------------------------------------
+    # Registry helpers
+    # ------------------------------------------------------------------
+    def _register(self, card: Card) -> int:
+        """Assign ``card`` a combat id (idempotent) and return it."""
+        cid = getattr(card, "_combat_id", -1)
+        if 0 <= cid < len(self.cards) and self.cards[cid] is card:
+            return cid
+        cid = len(self.cards)
+        self.cards.append(card)
+        card._combat_id = cid
+        return cid
+
+    def _attacker_slot(self, card: Card) -> int:
+        """Return ``card``'s attacker slot index, or ``-1`` if not attacking."""
+        slot = getattr(card, "_combat_idx", -1)
+        if 0 <= slot < len(self.attacker_ids) and self.cards[self.attacker_ids[slot]] is card:
+            return slot
+        return -1
 
-    attackers: Dict[Card, Any] = field(default_factory=dict)
-    blockers: Dict[Card, List[Card]] = field(default_factory=dict)
+    @staticmethod
+    def _attack_illegal_reason(mask: int, creature: Card, attacking_player: Player) -> str:
+        """Cold path: explain the first failed legality bit in ``mask``."""
+        if mask & _ATK_WRONG_ZONE:
+            return f"{creature.name} is not on the battlefield."
+        if mask & _ATK_WRONG_CONTROLLER:
+            return f"{creature.name} is not controlled by {attacking_player.name}."
+        if mask & _ATK_NOT_CREATURE:
+            return f"{creature.name} is not a creature."
+        if mask & _ATK_TAPPED:
+            return f"{creature.name} is tapped and can't attack."
+        return f"{creature.name} has summoning sickness."
 
     # ------------------------------------------------------------------
     # Declaration helpers
@@ -34,53 +106,57 @@ class CombatEngine:
     ) -> List[str]:
         """Declare attackers for ``attacking_player``."""
         log: List[str] = []
-        if game_state.current_phase() != "Declare Attackers":
+        log_enabled = self.log_enabled
+        if game_state.current_phase() is not Phase.DECLARE_ATTACKERS:
             return ["Attackers may only be declared during the Declare Attackers step."]
 
-        if not hasattr(game_state, "combat"):
-            game_state.combat = {"attackers": {}, "blockers": {}}
-
+        players = game_state.players
         for creature, defender in attacker_assignments:
             # Runtime-safe reads
             zone = getattr(creature, "zone", None)
             controller = getattr(creature, "controller", None)
-            type_line = getattr(creature, "type_line", "")
             tapped = getattr(creature, "tapped", False)
             summoning_sick = getattr(creature, "summoning_sick", False)
-            haste = getattr(creature, "haste", False)
+            flags = getattr(creature, "combat_flags", 0)
+            is_creature = getattr(creature, "is_creature", None)
+            if is_creature is None:
+                is_creature = "creature" in getattr(creature, "type_line", "").lower()
 
-            if zone != "battlefield":
-                log.append(f"{creature.name} is not on the battlefield.")
-                continue
-            if controller is not attacking_player:
-                log.append(f"{creature.name} is not controlled by {attacking_player.name}.")
-                continue
-            if "creature" not in type_line.lower():
-                log.append(f"{creature.name} is not a creature.")
-                continue
-            if tapped:
-                log.append(f"{creature.name} is tapped and can't attack.")
-                continue
-            if summoning_sick and not haste:
-                log.append(f"{creature.name} has summoning sickness.")
+            # One combined mask check keeps the legal fast path to a single
+            # predictable branch; message selection happens off it.
+            illegal = (
+                (zone != ZONE_BATTLEFIELD) * _ATK_WRONG_ZONE
+                | (controller is not attacking_player) * _ATK_WRONG_CONTROLLER
+                | (not is_creature) * _ATK_NOT_CREATURE
+                | bool(tapped) * _ATK_TAPPED
+                | bool(summoning_sick and not flags & FLAG_HASTE) * _ATK_SICK
+            )
+            if illegal:
+                if log_enabled:
+                    log.append(self._attack_illegal_reason(illegal, creature, attacking_player))
                 continue
 
             # TODO: inject effects like "must attack" or "can't attack" here
 
             legal_defender = False
-            if isinstance(defender, Player) and defender in game_state.players and defender is not attacking_player:
+            if isinstance(defender, Player) and defender in players and defender is not attacking_player:
                 legal_defender = True
-            elif getattr(defender, "controller", None) in game_state.players:
+            elif getattr(defender, "controller", None) in players:
                 legal_defender = True
             if not legal_defender:
-                log.append(f"{getattr(defender, 'name', str(defender))} is not a legal defender.")
+                if log_enabled:
+                    log.append(f"{getattr(defender, 'name', str(defender))} is not a legal defender.")
                 continue
 
-            self.attackers[creature] = defender
-            game_state.combat["attackers"][creature] = defender
-            setattr(creature, "tapped", True)
-            setattr(creature, "status", "attacking")
-            log.append(f"{creature.name} attacks {getattr(defender, 'name', str(defender))}.")
+            creature._combat_idx = len(self.attacker_ids)
+            self.attacker_ids.append(self._register(creature))
+            self.defenders.append(defender)
+            self.blockers_of.append([])
+            game_state.combat.attackers[creature] = defender
+            creature.tapped = True
+            creature.status = STATUS_ATTACKING
+            if log_enabled:
+                log.append(f"{creature.name} attacks {getattr(defender, 'name', str(defender))}.")
 
         return log
 
@@ -92,41 +168,51 @@ class CombatEngine:
     ) -> List[str]:
         """Declare blockers for ``defending_player``."""
         log: List[str] = []
-        if game_state.current_phase() != "Declare Blockers":
+        log_enabled = self.log_enabled
+        if game_state.current_phase() is not Phase.DECLARE_BLOCKERS:
             return ["Blockers may only be declared during the Declare Blockers step."]
 
-        if not hasattr(game_state, "combat") or not game_state.combat.get("attackers"):
+        if not game_state.combat.attackers:
             return ["No attackers have been declared."]
 
         for blocker, attacker in blocker_assignments:
             # Runtime-safe reads
             zone = getattr(blocker, "zone", None)
             controller = getattr(blocker, "controller", None)
-            type_line = getattr(blocker, "type_line", "")
             tapped = getattr(blocker, "tapped", False)
+            is_creature = getattr(blocker, "is_creature", None)
+            if is_creature is None:
+                is_creature = "creature" in getattr(blocker, "type_line", "").lower()
 
-            if zone != "battlefield":
-                log.append(f"{blocker.name} is not on the battlefield.")
+            if zone != ZONE_BATTLEFIELD:
+                if log_enabled:
+                    log.append(f"{blocker.name} is not on the battlefield.")
                 continue
             if controller is not defending_player:
-                log.append(f"{blocker.name} is not controlled by {defending_player.name}.")
+                if log_enabled:
+                    log.append(f"{blocker.name} is not controlled by {defending_player.name}.")
                 continue
-            if "creature" not in type_line.lower():
-                log.append(f"{blocker.name} is not a creature.")
+            if not is_creature:
+                if log_enabled:
+                    log.append(f"{blocker.name} is not a creature.")
                 continue
             if tapped:
-                log.append(f"{blocker.name} is tapped and can't block.")
+                if log_enabled:
+                    log.append(f"{blocker.name} is tapped and can't block.")
                 continue
-            if attacker not in self.attackers:
-                log.append(f"{attacker.name} is not attacking {defending_player.name}.")
+            slot = self._attacker_slot(attacker)
+            if slot < 0:
+                if log_enabled:
+                    log.append(f"{attacker.name} is not attacking {defending_player.name}.")
                 continue
 
             # TODO: apply evasion rules (flying, menace, etc.) via TargetingSystem
 
-            self.blockers.setdefault(blocker, []).append(attacker)
-            game_state.combat.setdefault("blockers", {}).setdefault(blocker, []).append(attacker)
-            setattr(blocker, "status", "blocking")
-            log.append(f"{blocker.name} blocks {attacker.name}.")
+            self.blockers_of[slot].append(self._register(blocker))
+            game_state.combat.blockers[blocker].append(attacker)
+            blocker.status = STATUS_BLOCKING
+            if log_enabled:
+                log.append(f"{blocker.name} blocks {attacker.name}.")
 
         return log
 
@@ -135,51 +221,90 @@ class CombatEngine:
     # ------------------------------------------------------------------
     def assign_combat_damage(self, game_state: GameState) -> List[str]:
         """Resolve combat damage for the current combat step."""
+        if not self.attacker_ids:
+            return []
         log: List[str] = []
-        if not hasattr(game_state, "combat"):
-            return log
+        # Damage and life writes below must reach the dirty set, or the
+        # SBA pass in this same phase won't see the kills.
+        mark_dirty = getattr(game_state, "mark_dirty", None)
 
         # TODO: implement APNAP ordering when multiple players assign damage
-        for attacker, defender in list(self.attackers.items()):
-            # Safe reads
-            a_power = int(getattr(attacker, "power", 0) or 0)
-            a_deathtouch = bool(getattr(attacker, "deathtouch", False))
-            a_trample = bool(getattr(attacker, "trample", False))
+        self._resolve_unblocked(log, mark_dirty)
+        self._resolve_blocked(log, mark_dirty)
 
-            blockers = [b for b, att_list in self.blockers.items() if attacker in att_list]
-            if not blockers:
-                if hasattr(defender, "life"):
-                    defender.life -= a_power
+        # TODO: triggers like "whenever this creature deals combat damage"
+        # TODO: post-combat cleanup handled by StateBasedActions
+        return log
+
+    def _resolve_unblocked(self, log: List[str], mark_dirty=None) -> None:
+        """Apply damage from every unblocked attacker to its defender.
+
+        Damage is accumulated per defender first so each defender's life
+        total is written once, however wide the attack is.
+        """
+        log_enabled = self.log_enabled
+        totals: Dict[Any, int] = {}
+        for slot, atk_id in enumerate(self.attacker_ids):
+            if self.blockers_of[slot]:
+                continue
+            attacker = self.cards[atk_id]
+            defender = self.defenders[slot]
+            a_power = int(getattr(attacker, "power", 0) or 0)
+            if hasattr(defender, "life"):
+                totals[defender] = totals.get(defender, 0) + a_power
+            if log_enabled:
                 log.append(f"{attacker.name} deals {a_power} damage to {getattr(defender, 'name', str(defender))}.")
+        for defender, total in totals.items():
+            defender.life -= total
+            if mark_dirty is not None:
+                mark_dirty(defender)
+
+    def _resolve_blocked(self, log: List[str], mark_dirty=None) -> None:
+        """Resolve the blocked attackers' damage exchanges."""
+        log_enabled = self.log_enabled
+        for slot, atk_id in enumerate(self.attacker_ids):
+            if not self.blockers_of[slot]:
                 continue
+            attacker = self.cards[atk_id]
+            defender = self.defenders[slot]
+            # Safe reads
+            a_power = int(getattr(attacker, "power", 0) or 0)
+            a_flags = getattr(attacker, "combat_flags", 0)
+            a_deathtouch = a_flags & FLAG_DEATHTOUCH
+            a_trample = a_flags & FLAG_TRAMPLE
+
+            blockers = [self.cards[b_id] for b_id in self.blockers_of[slot]]
 
             remaining = a_power
             for blocker in blockers:
                 b_tough = int(getattr(blocker, "toughness", 0) or 0)
-                b_damage = int(getattr(blocker, "damage", 0) or 0)
-                dmg = 1 if a_deathtouch else max(0, min(remaining, b_tough - b_damage))
-                setattr(blocker, "damage", b_damage + dmg)
+                # damage is a guaranteed Card field now; no getattr needed.
+                dmg = 1 if a_deathtouch else max(0, min(remaining, b_tough - blocker.damage))
+                blocker.damage += dmg
                 remaining -= dmg
-                log.append(f"{attacker.name} deals {dmg} damage to {blocker.name}.")
+                if dmg and mark_dirty is not None:
+                    mark_dirty(blocker)
+                if log_enabled:
+                    log.append(f"{attacker.name} deals {dmg} damage to {blocker.name}.")
                 if remaining <= 0:
                     break
 
             if remaining > 0 and a_trample:
                 if hasattr(defender, "life"):
                     defender.life -= remaining
-                log.append(f"{attacker.name} deals {remaining} trample damage to {getattr(defender, 'name', str(defender))}.")
+                    if mark_dirty is not None:
+                        mark_dirty(defender)
+                if log_enabled:
+                    log.append(f"{attacker.name} deals {remaining} trample damage to {getattr(defender, 'name', str(defender))}.")
 
             for blocker in blockers:
                 b_power = int(getattr(blocker, "power", 0) or 0)
-                b_deathtouch = bool(getattr(blocker, "deathtouch", False))
-                dealt = 1 if b_deathtouch else b_power
-                a_damage = int(getattr(attacker, "damage", 0) or 0)
-                setattr(attacker, "damage", a_damage + dealt)
-                log.append(f"{blocker.name} deals {dealt} damage to {attacker.name}.")
-
-        # TODO: triggers like "whenever this creature deals combat damage"
-        # TODO: post-combat cleanup handled by StateBasedActions
-        return log
+                dealt = 1 if getattr(blocker, "combat_flags", 0) & FLAG_DEATHTOUCH else b_power
+                attacker.damage += dealt
+                if dealt and mark_dirty is not None:
+                    mark_dirty(attacker)
+                if log_enabled:
+                    log.append(f"{blocker.name} deals {dealt} damage to {attacker.name}.")
 
 
 __all__ = ["CombatEngine"]
@@ -8,20 +8,44 @@ requesting data from the Scryfall API when needed.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+import atexit
+import logging
 import os
 import json
+import re
+import time
 
 try:
     import requests
 except Exception:  # pragma: no cover - optional dependency
     requests = None
 
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+logger = logging.getLogger("mtg_engine")
+
+
+def _read_json(path: str) -> Any:
+    """Load a JSON file, using orjson's C parser when available."""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
 
 class CardComponent:
     """Base class for modular card components such as abilities."""
 
+    __slots__ = ()
+
     def on_play(self, game_state: Any) -> None:
         pass
 
@@ -35,59 +59,164 @@ class CardDataManager:
     def __init__(self, cache_file: str = "card_cache.json") -> None:
         self.cache_file = cache_file
         self.cache: Dict[str, Dict[str, Any]] = self.load_cache()
+        self._dirty = False
+        self._session = None
+
+    def __enter__(self) -> "CardDataManager":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.flush()
 
     def load_cache(self) -> Dict[str, Dict[str, Any]]:
         try:
-            with open(self.cache_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
+            return _read_json(self.cache_file)
+        except (FileNotFoundError, ValueError):
+            # orjson.JSONDecodeError and json.JSONDecodeError both subclass
+            # ValueError, so a corrupt cache falls back to empty either way.
             return {}
 
     def save_cache(self) -> None:
+        # Write compactly to a sibling tempfile and swap it in so a crash
+        # mid-write never leaves a truncated cache behind.
+        tmp = self.cache_file + ".tmp"
         try:
-            with open(self.cache_file, "w", encoding="utf-8") as f:
-                json.dump(self.cache, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                with open(tmp, "wb") as f:
+                    f.write(orjson.dumps(self.cache))
+            else:
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump(self.cache, f, separators=(",", ":"), ensure_ascii=False)
+            os.replace(tmp, self.cache_file)
+            self._dirty = False
         except Exception:
             # Cache write failures should not crash runtime.
             pass
 
+    def flush(self) -> None:
+        """Persist the cache if new entries were added since the last save."""
+        if self._dirty:
+            self.save_cache()
+
     def import_cache(self, cache_file: str) -> None:
         try:
-            with open(cache_file, "r", encoding="utf-8") as f:
-                external_cache = json.load(f)
+            external_cache = _read_json(cache_file)
             self.cache.update(external_cache)
             self.save_cache()
-            print(f"[INFO] Successfully imported card cache from {cache_file}")
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            print(f"[WARNING] Failed to import cache from {cache_file}: {e}")
+            logger.info("Successfully imported card cache from %s", cache_file)
+        except (FileNotFoundError, ValueError) as e:
+            logger.warning("Failed to import cache from %s: %s", cache_file, e)
 
     def get_card(self, card_name: str) -> Dict[str, Any] | None:
         return self.get_card_data(card_name)
 
     def get_card_data(self, card_name: str) -> Dict[str, Any] | None:
-        if card_name in self.cache:
-            return self.cache[card_name]
+        # Single .get instead of `in` + [] — one hash/probe on the hot path.
+        card_data = self.cache.get(card_name)
+        if card_data is not None:
+            return card_data
 
         card_data = self.fetch_from_scryfall(card_name)
         if card_data:
             self.cache[card_name] = card_data
-            self.save_cache()
+            # Defer the disk write: a deck load may miss dozens of times and
+            # rewriting the whole cache per miss makes loading I/O-bound.
+            self._dirty = True
             return card_data
 
         lower_name = card_name.lower()
         if not (lower_name.startswith("dummy") or lower_name == "unknown card"):
-            print(f"[ERROR] Scryfall could not find card: {card_name}")
-            print(f"[WARNING] Failed to load card data for: {card_name}")
+            logger.error("Scryfall could not find card: %s", card_name)
+            logger.warning("Failed to load card data for: %s", card_name)
         return None
 
+    def _get_session(self):
+        """Return a shared HTTP session (connection reuse across fetches)."""
+        if self._session is None and requests is not None:
+            self._session = requests.Session()
+            # Scryfall asks clients to identify themselves and rate-limits
+            # anonymous traffic more aggressively.
+            self._session.headers.update({
+                "User-Agent": "CustomMtGEngine/1.0",
+                "Accept": "application/json",
+            })
+        return self._session
+
+    def _send(self, method: str, url: str, **kwargs):
+        """Issue ``method`` on the shared session, retrying once on a 429.
+
+        Scryfall signals rate limiting with 429 + a Retry-After header;
+        honoring it avoids burning the whole burst budget on rejections.
+        """
+        session = self._get_session()
+        response = session.request(method, url, timeout=10, **kwargs)
+        if response.status_code == 429:
+            try:
+                delay = float(response.headers.get("Retry-After", 1))
+            except (TypeError, ValueError):
+                delay = 1.0
+            time.sleep(delay)
+            response = session.request(method, url, timeout=10, **kwargs)
+        return response
+
+    def prefetch(self, names: Iterable[str]) -> None:
+        """Warm the cache for ``names`` in bulk before Card construction.
+
+        Uncached names are fetched through Scryfall's ``cards/collection``
+        endpoint, which accepts up to 75 identifiers per request, so loading
+        a deck costs ceil(N/75) HTTP round-trips instead of N.  Chunks are
+        fetched concurrently and the cache is flushed once at the end.
+        """
+        missing = [n for n in dict.fromkeys(names) if n not in self.cache]
+        if not missing or requests is None:
+            return
+        chunks = [missing[i:i + 75] for i in range(0, len(missing), 75)]
+        if len(chunks) == 1:
+            results = [self._fetch_collection(chunks[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                results = list(pool.map(self._fetch_collection, chunks))
+        for found in results:
+            for name, data in found.items():
+                self.cache[name] = data
+                self._dirty = True
+        self.flush()
+
+    def _fetch_collection(self, chunk: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch one batch of up to 75 names; returns requested-name keyed data."""
+        requested_by_lower = {n.lower(): n for n in chunk}
+        found: Dict[str, Dict[str, Any]] = {}
+        try:
+            response = self._send(
+                "POST",
+                "https://api.scryfall.com/cards/collection",
+                json={"identifiers": [{"name": n} for n in chunk]},
+            )
+            if response.status_code != 200:
+                return found
+            for card_info in response.json().get("data", []):
+                requested = requested_by_lower.get((card_info.get("name") or "").lower())
+                if requested is None:
+                    continue
+                found[requested] = {
+                    "oracle_text": card_info.get("oracle_text", "") or "",
+                    "type_line": card_info.get("type_line", "") or "",
+                    "mana_cost": card_info.get("mana_cost", "") or "",
+                    "power": card_info.get("power", None),
+                    "toughness": card_info.get("toughness", None),
+                }
+        except Exception as e:  # pragma: no cover - network errors
+            logger.error("Failed to bulk-fetch cards from Scryfall: %s", e)
+        return found
+
     def fetch_from_scryfall(self, card_name: str) -> Dict[str, Any] | None:
         url = f"https://api.scryfall.com/cards/named?exact={card_name}"
         if requests is None:
             # RUNTIME SAFETY: don't hard-fail when requests isn't installed.
-            print("[WARNING] 'requests' not installed; cannot fetch from Scryfall.")
+            logger.warning("'requests' not installed; cannot fetch from Scryfall.")
             return None
         try:
-            response = requests.get(url, timeout=10)
+            response = self._send("GET", url)
             if response.status_code == 200:
                 card_info = response.json()
                 return {
@@ -100,7 +229,7 @@ class CardDataManager:
                 }
             return None
         except Exception as e:  # pragma: no cover - network errors
-            print(f"[ERROR] Failed to fetch card from Scryfall: {e}")
+            logger.error("Failed to fetch card from Scryfall: %s", e)
             return None
 
     @staticmethod
@@ -112,10 +241,53 @@ class CardDataManager:
         return Card(name)
 
 
-# Global manager instance used by ``Card`` objects
+# Global manager instance used by ``Card`` objects.  load_cache() in
+# __init__ already reads card_cache.json; re-importing the same file here
+# only rewrote it to disk on every process start, so it was dropped.
 _cache_file = os.path.join(os.path.dirname(__file__), "card_cache.json")
 _card_data_manager = CardDataManager(cache_file=_cache_file)
-_card_data_manager.import_cache(_cache_file)
+# Cards constructed outside a ``with CardDataManager()`` block mark the global
+# manager dirty; flush once at shutdown instead of after every fetch.
+atexit.register(_card_data_manager.flush)
+
+
+def shared_card_data_manager() -> CardDataManager:
+    """Return the module-global manager that ``Card.__post_init__`` consults.
+
+    Callers that warm the cache ahead of bulk Card construction (deck
+    loading) must prefetch through this instance — a private
+    ``CardDataManager()`` reads and warms a different cache file, and
+    the constructions still miss.
+    """
+    return _card_data_manager
+
+
+# Combat keyword flags packed into ``Card.combat_flags``.  Bits 1 and 2 are
+# reserved for tapped/summoning-sickness; those are mutable turn state and
+# currently live on plain attributes, so only the static Oracle keywords are
+# derived into the mask.
+FLAG_TAPPED = 1
+FLAG_SUMMONING_SICK = 2
+FLAG_HASTE = 4
+FLAG_DEATHTOUCH = 8
+FLAG_TRAMPLE = 16
+FLAG_FLYING = 32
+FLAG_MENACE = 64
+FLAG_REACH = 128
+
+# One compiled pattern walks the Oracle text a single time instead of one
+# substring scan (plus a .lower() allocation) per keyword.
+_KEYWORD_RE = re.compile(
+    r"\b(haste|deathtouch|trample|flying|menace|reach)\b", re.IGNORECASE
+)
+_KEYWORD_BITS = {
+    "haste": FLAG_HASTE,
+    "deathtouch": FLAG_DEATHTOUCH,
+    "trample": FLAG_TRAMPLE,
+    "flying": FLAG_FLYING,
+    "menace": FLAG_MENACE,
+    "reach": FLAG_REACH,
+}
 
 
 def _coerce_int(val: Any, default: int = 0) -> int:
@@ -125,9 +297,16 @@ def _coerce_int(val: Any, default: int = 0) -> int:
         return default
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class Card:
-    """Representation of a Magic card and its parsed attributes."""
+    """Representation of a Magic card and its parsed attributes.
+
+    ``slots=True`` drops the per-instance ``__dict__`` (hundreds of Cards
+    per game, thousands in AI rollouts), so every attribute the engine
+    writes at runtime must be declared below.  ``eq=False`` keeps identity
+    equality and hashing — two copies of the same card are distinct game
+    objects, and combat code keys dicts by Card instance.
+    """
 
     name: str
     oracle_text: str = ""
@@ -141,10 +320,33 @@ class Card:
     power: int = 0
     toughness: int = 0
 
+    # Static combat keywords packed into one int; see the FLAG_* constants.
+    combat_flags: int = 0
+
+    # Cached type-line checks; computed once instead of per combat call.
+    is_creature: bool = False
+    is_planeswalker: bool = False
+    is_land: bool = False
+    type_line_lower: str = ""
+
+    # Mutable in-game state written by GameState/Player/CombatEngine.
+    zone: str = ""
+    controller: Any = None
+    tapped: bool = False
+    summoning_sick: bool = False
+    status: str = ""
+    damage: int = 0
+    is_face_down: bool = False
+
+    # Combat registry indices maintained by CombatEngine.
+    _combat_id: int = field(default=-1, init=False, repr=False)
+    _combat_idx: int = field(default=-1, init=False, repr=False)
+
     def __post_init__(self) -> None:
+        # get_card already falls back to a Scryfall fetch on a cache
+        # miss; retrying the fetch here only doubled the failed round
+        # trip for unknown names.
         card_data = _card_data_manager.get_card(self.name)
-        if not card_data:
-            card_data = _card_data_manager.fetch_from_scryfall(self.name)
 
         self.data = card_data or {}
 
@@ -159,7 +361,33 @@ class Card:
             if "toughness" in card_data:
                 self.toughness = _coerce_int(card_data.get("toughness"), default=self.toughness)
         else:
-            print(f"[WARNING] Failed to load card data for: {self.name}")
-
-
-__all__ = ["Card", "CardComponent", "CardDataManager"]
+            logger.warning("Failed to load card data for: %s", self.name)
+
+        # Derive the keyword bitmask once so combat checks are a single
+        # AND instead of repeated getattr probes per creature per step.
+        flags = 0
+        for match in _KEYWORD_RE.finditer(self.oracle_text):
+            flags |= _KEYWORD_BITS[match.group(1).lower()]
+        self.combat_flags = flags
+
+        type_lower = self.type_line.lower()
+        self.type_line_lower = type_lower
+        self.is_creature = "creature" in type_lower
+        self.is_planeswalker = "planeswalker" in type_lower
+        self.is_land = "land" in type_lower
+
+
+__all__ = [
+    "Card",
+    "CardComponent",
+    "CardDataManager",
+    "shared_card_data_manager",
+    "FLAG_TAPPED",
+    "FLAG_SUMMONING_SICK",
+    "FLAG_HASTE",
+    "FLAG_DEATHTOUCH",
+    "FLAG_TRAMPLE",
+    "FLAG_FLYING",
+    "FLAG_MENACE",
+    "FLAG_REACH",
+]
@@ -10,14 +10,50 @@ handles cache lookup and Oracle parsing.
 
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Iterable
+import atexit
+import functools
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+import gzip
 import hashlib
 import json
+import logging
+import os
+import sys
+import tempfile
+import time
 
 try:
     import requests
 except Exception:  # pragma: no cover - optional dependency
     requests = None
 
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import xxhash
+except Exception:  # pragma: no cover - optional dependency
+    xxhash = None
+
+try:
+    import zstandard
+except Exception:  # pragma: no cover - optional dependency
+    zstandard = None
+
+logger = logging.getLogger("mtg_engine")
+
+# oracle_hash/card_fingerprint are identity keys, not security digests, so
+# the fastest available non-cryptographic hash is fine.
+if xxhash is not None:
+    def _fast_hash(data: bytes) -> str:
+        return xxhash.xxh3_64(data).hexdigest()
+else:
+    def _fast_hash(data: bytes) -> str:
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
 # --- RUNTIME SAFETY: Make parser/lexicon imports non-fatal -----------------
 try:
     from oracle_parser.OracleParser import OracleParser  # type: ignore
@@ -32,8 +68,80 @@ except Exception:
     STATIC_KEYWORDS: List[str] = []
 # --------------------------------------------------------------------------
 
+try:
+    import ahocorasick
+except Exception:  # pragma: no cover - optional dependency
+    ahocorasick = None
+
+# With pyahocorasick installed, keyword detection is one pass over the text
+# instead of one substring scan per STATIC_KEYWORDS entry.
+if ahocorasick is not None and STATIC_KEYWORDS:
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _kw in STATIC_KEYWORDS:
+        if _kw:
+            _KEYWORD_AUTOMATON.add_word(_kw.lower(), _kw)
+    _KEYWORD_AUTOMATON.make_automaton()
+else:
+    _KEYWORD_AUTOMATON = None
+
+
+# One parser instance for every CardMetadata construction; OracleParser
+# keeps no per-card state between parse() calls.
+_PARSER = OracleParser()
+
 
-@dataclass
+def _scan_static_keywords(text_lower: str) -> List[str]:
+    """Return the static keywords present in ``text_lower``."""
+    if _KEYWORD_AUTOMATON is not None:
+        return list(dict.fromkeys(v for _, v in _KEYWORD_AUTOMATON.iter(text_lower)))
+    return [kw for kw in STATIC_KEYWORDS if kw and kw in text_lower]
+
+
+# Supertype words recognized in type lines; frozenset for O(1) membership.
+_SUPERTYPES = frozenset(("Basic", "Legendary", "Snow", "World", "Ongoing"))
+
+# Interned zone literal shared by every GameCard; zone comparisons against
+# it short-circuit on the pointer check before any character compare.
+ZONE_LIBRARY = sys.intern("library")
+
+def _maybe_decompress(raw: bytes) -> bytes:
+    """Transparently undo cache-file compression, sniffed by magic bytes."""
+    if raw[:4] == b"\x28\xb5\x2f\xfd":
+        if zstandard is None:
+            raise OSError("cache is zstd-compressed but zstandard is not installed")
+        return zstandard.ZstdDecompressor().decompress(raw)
+    if raw[:2] == b"\x1f\x8b":
+        return gzip.decompress(raw)
+    return raw
+
+
+def _maybe_compress(payload: bytes, path: str) -> bytes:
+    """Compress ``payload`` according to ``path``'s extension.
+
+    Plain ``.json`` stays uncompressed so the default cache file remains
+    readable by every consumer; point ``cache_file`` at ``.json.gz`` (or
+    ``.json.zst`` with zstandard installed) to cut cold-load I/O by 2-4x.
+    """
+    if path.endswith(".zst") and zstandard is not None:
+        return zstandard.ZstdCompressor(level=3).compress(payload)
+    if path.endswith(".gz"):
+        return gzip.compress(payload, compresslevel=6)
+    return payload
+
+
+# Parsed cache contents keyed by (abspath, mtime_ns, size).  Repeated
+# CardRepository() instantiations (tests, REPLs, forked workers) reuse the
+# already-parsed dict instead of re-reading and re-decoding the whole file;
+# any on-disk change alters the stat key and forces a fresh parse.
+_CACHE_BY_PATH: Dict[tuple, Dict[str, Dict[str, Any]]] = {}
+
+# Shared empty sequence for CardMetadata fields that parsed to nothing.
+# Most cards have no supertypes and vanilla cards have no clauses at all;
+# one immutable sentinel replaces five throwaway list allocations per card.
+_EMPTY: tuple = ()
+
+
+@dataclass(slots=True)
 class ClauseBlock:
     """Minimal representation of a parsed Oracle clause."""
     raw: str
@@ -42,27 +150,47 @@ class ClauseBlock:
     condition: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CardMetadata:
     """Static card metadata parsed from Scryfall's Oracle information."""
     name: str
     oracle_text: str = ""
     type_line: str = ""
     mana_cost: str = ""
-    supertypes: List[str] = field(default_factory=list)
-    types: List[str] = field(default_factory=list)
-    subtypes: List[str] = field(default_factory=list)
-    oracle_clauses: List[ClauseBlock] = field(default_factory=list)
-    static_abilities: List[str] = field(default_factory=list)
-    behavior_tree: List[Any] = field(default_factory=list)
+    # ``__post_init__`` always assigns these, so eager ``default_factory=list``
+    # would allocate five lists per card only to drop them immediately.
+    supertypes: List[str] = field(default=None)  # type: ignore[assignment]
+    types: List[str] = field(default=None)  # type: ignore[assignment]
+    subtypes: List[str] = field(default=None)  # type: ignore[assignment]
+    oracle_clauses: List[ClauseBlock] = field(default=None)  # type: ignore[assignment]
+    static_abilities: List[str] = field(default=None)  # type: ignore[assignment]
+    behavior_tree: List[Any] = field(default=None)  # type: ignore[assignment]
     oracle_hash: str = ""
     card_fingerprint: str = ""
+    #: Lowercased card types as a frozenset; ``"creature" in meta.type_set``
+    #: is one hash probe instead of a substring scan over the type line.
+    type_set: frozenset = field(default=None, init=False, repr=False)  # type: ignore[assignment]
 
     def __post_init__(self) -> None:
+        # Card names and type words repeat across thousands of instances;
+        # interning collapses the duplicates and makes later equality
+        # checks and dict lookups pointer-fast.
+        self.name = sys.intern(self.name)
         self._parse_type_line()
+        self.type_set = frozenset(t.lower() for t in self.types)
+
+        # Vanilla creatures and basic lands have no Oracle text at all;
+        # skip the parser and keyword scan entirely for them.
+        if not self.oracle_text.strip():
+            self.oracle_clauses = _EMPTY
+            self.behavior_tree = _EMPTY
+            self.static_abilities = _EMPTY
+            self.oracle_hash = _fast_hash(self.oracle_text.encode())
+            fingerprint_str = f"{self.name}|{self.mana_cost}|{self.type_line}"
+            self.card_fingerprint = _fast_hash(fingerprint_str.encode())
+            return
 
-        parser = OracleParser()
-        parsed = parser.parse(self.oracle_text)
+        parsed = _PARSER.parse(self.oracle_text)
 
         # Normalize parsed into a list safely
         if parsed is None:
@@ -91,15 +219,15 @@ class CardMetadata:
                     condition=getattr(ir, "condition", None),
                 )
                 for line, ir in zip(lines, parsed_list)
-            ]
-            self.behavior_tree = [getattr(ir, "action", {}) for ir in parsed_list]
+            ] or _EMPTY
+            self.behavior_tree = [getattr(ir, "action", {}) for ir in parsed_list] or _EMPTY
 
         text_lower = self.oracle_text.lower()
-        self.static_abilities = [kw for kw in STATIC_KEYWORDS if kw and kw in text_lower]
+        self.static_abilities = _scan_static_keywords(text_lower) or _EMPTY
 
-        self.oracle_hash = hashlib.sha1(self.oracle_text.encode()).hexdigest()
+        self.oracle_hash = _fast_hash(self.oracle_text.encode())
         fingerprint_str = f"{self.name}|{self.mana_cost}|{self.type_line}"
-        self.card_fingerprint = hashlib.sha1(fingerprint_str.encode()).hexdigest()
+        self.card_fingerprint = _fast_hash(fingerprint_str.encode())
 
     # ------------------------------------------------------------------
     # Parsing helpers
@@ -107,32 +235,28 @@ class CardMetadata:
     def _parse_type_line(self) -> None:
         """Break ``type_line`` into super, card and sub types."""
         if not self.type_line:
+            self.supertypes = self.types = self.subtypes = _EMPTY
             return
-        parts = [p.strip() for p in self.type_line.split("—")]
-        main = parts[0]
-        subtypes: List[str] = []
-        if len(parts) > 1:
-            subtypes = [s.strip() for s in parts[1].split()] if parts[1] else []
-        words = main.split()
+        main, _, sub = self.type_line.partition("—")
         supertypes: List[str] = []
         types: List[str] = []
-        for w in words:
-            if w in ["Basic", "Legendary", "Snow", "World", "Ongoing"]:
-                supertypes.append(w)
+        for w in main.split():
+            if w in _SUPERTYPES:
+                supertypes.append(sys.intern(w))
             else:
-                types.append(w)
-        self.supertypes = supertypes
-        self.types = types
-        self.subtypes = subtypes
+                types.append(sys.intern(w))
+        self.supertypes = supertypes or _EMPTY
+        self.types = types or _EMPTY
+        self.subtypes = [sys.intern(w) for w in sub.split()] or _EMPTY
 
 
-@dataclass
+@dataclass(slots=True)
 class GameCard:
     """In-game representation of a card instance."""
     metadata: CardMetadata
     owner: Any | None = None
     controller: Any | None = None
-    zone: str = "library"
+    zone: str = ZONE_LIBRARY
     tapped: bool = False
     damage: int = 0
     is_token: bool = False
@@ -142,29 +266,142 @@ class GameCard:
         return self.metadata.name
 
     def is_creature(self) -> bool:
-        return "Creature" in self.metadata.types
+        return "creature" in self.metadata.type_set
+
+
+@functools.lru_cache(maxsize=4096)
+def _build_metadata(name: str, oracle_text: str, type_line: str, mana_cost: str) -> CardMetadata:
+    """Construct (or reuse) the metadata for one card.
+
+    ``CardMetadata`` is immutable after ``__post_init__`` runs, so repeated
+    lookups of the same card share one instance instead of re-running the
+    Oracle parse, type-line split and fingerprint hashing every time.
+    """
+    return CardMetadata(
+        name=name, oracle_text=oracle_text, type_line=type_line, mana_cost=mana_cost
+    )
+
+
+# Repositories awaiting a shutdown flush, held weakly: registering each
+# instance's bound method with atexit would pin the instance (and its
+# whole cache dict) for the life of the process, and repositories are
+# instantiated freely (tests, REPLs, forked workers).  One module-level
+# hook walks whatever instances are still alive, mirroring the one-time
+# atexit registration in CardEntities.
+_LIVE_REPOSITORIES: "weakref.WeakSet[CardRepository]" = weakref.WeakSet()
+
+
+def _flush_live_repositories() -> None:
+    for repository in list(_LIVE_REPOSITORIES):
+        repository._flush_if_dirty()
+
+
+atexit.register(_flush_live_repositories)
 
 
 class CardRepository:
     """Cache-backed provider of :class:`CardMetadata` objects."""
 
+    #: Minimum seconds between automatic cache writes during warmup.
+    _FLUSH_INTERVAL = 5.0
+
     def __init__(self, cache_file: str = "card_cache.json") -> None:
         self.cache_file = cache_file
         self.cache: Dict[str, Dict[str, Any]] = self._load_cache()
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        _LIVE_REPOSITORIES.add(self)
+        self._session = self._make_session()
+
+    @staticmethod
+    def _make_session():
+        """Build a pooled, retrying HTTP session (None without requests)."""
+        if requests is None:
+            return None
+        session = requests.Session()
+        try:
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(total=3, backoff_factor=0.3),
+            )
+            session.mount("https://", adapter)
+        except Exception:  # pragma: no cover - adapter config is best-effort
+            pass
+        return session
 
     # ------------------------------------------------------------------
     # Cache file helpers
     # ------------------------------------------------------------------
     def _load_cache(self) -> Dict[str, Dict[str, Any]]:
         try:
-            with open(self.cache_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
+            st = os.stat(self.cache_file)
+        except OSError:
+            return {}
+        key = (os.path.abspath(self.cache_file), st.st_mtime_ns, st.st_size)
+        cached = _CACHE_BY_PATH.get(key)
+        if cached is not None:
+            return cached
+        try:
+            with open(self.cache_file, "rb") as f:
+                raw = f.read()
+            raw = _maybe_decompress(raw)
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except (FileNotFoundError, ValueError, OSError):
+            # Both JSON decoders raise ValueError subclasses on corrupt
+            # input; gzip raises OSError on a truncated stream.
             return {}
+        _CACHE_BY_PATH.clear()
+        _CACHE_BY_PATH[key] = data
+        return data
 
     def _save_cache(self) -> None:
-        with open(self.cache_file, "w", encoding="utf-8") as f:
-            json.dump(self.cache, f, indent=2, ensure_ascii=False)
+        # Write to a sibling temp file and rename it into place: a crash
+        # mid-write can no longer truncate the live cache, which is what
+        # makes the debounced/batched flushing safe.
+        cache_dir = os.path.dirname(os.path.abspath(self.cache_file)) or "."
+        fd, tmp = tempfile.mkstemp(prefix=".cache-", dir=cache_dir)
+        try:
+            # Compact JSON: nothing parses the old indent=2 padding, and on
+            # cold load I/O bandwidth dominates, so smaller is strictly
+            # faster.  A .gz/.zst cache file is compressed on top of that.
+            if orjson is not None:
+                payload = orjson.dumps(self.cache)
+            else:
+                payload = json.dumps(
+                    self.cache, separators=(",", ":"), ensure_ascii=False
+                ).encode("utf-8")
+            payload = _maybe_compress(payload, self.cache_file)
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp, self.cache_file)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        # Re-key the module-level memo so the next instantiation reuses
+        # this dict instead of re-parsing what we just wrote.
+        try:
+            st = os.stat(self.cache_file)
+        except OSError:  # pragma: no cover - file vanished mid-save
+            return
+        _CACHE_BY_PATH.clear()
+        _CACHE_BY_PATH[(os.path.abspath(self.cache_file), st.st_mtime_ns, st.st_size)] = self.cache
+
+    def flush(self) -> None:
+        """Write the cache to disk immediately."""
+        self._save_cache()
+
+    def _flush_if_dirty(self) -> None:
+        if self._dirty:
+            self._save_cache()
 
     def import_cache(self, path: str) -> None:
         try:
@@ -172,9 +409,9 @@ class CardRepository:
                 data = json.load(f)
             self.cache.update(data)
             self._save_cache()
-            print(f"[INFO] Imported card cache from {path}")
+            logger.info("Imported card cache from %s", path)
         except (FileNotFoundError, json.JSONDecodeError) as exc:
-            print(f"[WARNING] Failed to import cache {path}: {exc}")
+            logger.warning("Failed to import cache %s: %s", path, exc)
 
     # ------------------------------------------------------------------
     # Public API
@@ -186,7 +423,12 @@ class CardRepository:
         fetched = self._fetch_from_scryfall(name)
         if fetched:
             self.cache[key] = fetched
-            self._save_cache()
+            # Debounce: rewriting the whole file per miss makes cache warmup
+            # O(N^2) bytes written.  Mark dirty and flush at most every few
+            # seconds; the atexit hook persists whatever remains.
+            self._dirty = True
+            if time.monotonic() - self._last_flush > self._FLUSH_INTERVAL:
+                self._save_cache()
             return fetched
         return None
 
@@ -194,29 +436,97 @@ class CardRepository:
         data = self.get_card_data(name)
         if not data:
             return None
-        # Filter to only the fields CardMetadata accepts to avoid TypeError
-        allowed = {"oracle_text", "type_line", "mana_cost"}
-        filtered = {k: v for k, v in data.items() if k in allowed}
-        return CardMetadata(name=name, **filtered)
+        return _build_metadata(
+            name,
+            data.get("oracle_text", "") or "",
+            data.get("type_line", "") or "",
+            data.get("mana_cost", "") or "",
+        )
 
     # ------------------------------------------------------------------
     # Scryfall access (optional)
     # ------------------------------------------------------------------
+    def batch_load(self, names: Iterable[str]) -> None:
+        """Fetch any uncached ``names`` concurrently and flush once.
+
+        Cold-cache imports are dominated by connection and round-trip
+        latency; the pooled session keeps connections alive and a small
+        worker pool overlaps the waits while staying well under Scryfall's
+        request-rate guidance.
+        """
+        missing = [n for n in dict.fromkeys(names) if n.lower() not in self.cache]
+        if not missing or self._session is None:
+            return
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            for name, fetched in zip(missing, pool.map(self._fetch_from_scryfall, missing)):
+                if fetched:
+                    self.cache[name.lower()] = fetched
+                    self._dirty = True
+        self._flush_if_dirty()
+
+    def prime_from_bulk(self, kind: str = "oracle_cards") -> int:
+        """Build the local cache from Scryfall's bulk-data dump in one go.
+
+        One download of the ``oracle_cards`` dump replaces thousands of
+        per-card round trips on first run.  The dump is stream-parsed with
+        ijson when available to bound peak memory; otherwise it is decoded
+        in one piece.  Returns the number of cards imported.
+        """
+        if self._session is None:
+            return 0
+        try:
+            listing = self._session.get("https://api.scryfall.com/bulk-data", timeout=30)
+            if listing.status_code != 200:
+                return 0
+            entry = next(
+                (e for e in listing.json().get("data", []) if e.get("type") == kind),
+                None,
+            )
+            if not entry or not entry.get("download_uri"):
+                return 0
+            resp = self._session.get(entry["download_uri"], stream=True, timeout=300)
+            if resp.status_code != 200:
+                return 0
+            try:
+                import ijson
+                cards: Iterable[Dict[str, Any]] = ijson.items(resp.raw, "item")
+            except Exception:
+                cards = resp.json()
+            count = 0
+            for card in cards:
+                name = (card.get("name") or "").lower()
+                if not name:
+                    continue
+                self.cache[name] = {
+                    "oracle_text": card.get("oracle_text", "") or "",
+                    "type_line": card.get("type_line", "") or "",
+                    "mana_cost": card.get("mana_cost", "") or "",
+                }
+                count += 1
+            if count:
+                self._save_cache()
+            return count
+        except Exception as exc:  # pragma: no cover - network errors
+            logger.error("Failed to prime cache from Scryfall bulk data: %s", exc)
+            return 0
+
     def _fetch_from_scryfall(self, name: str) -> Dict[str, Any] | None:
         url = f"https://api.scryfall.com/cards/named?exact={name}"
-        if requests is None:
+        if self._session is None:
             return None
         try:
-            resp = requests.get(url, timeout=10)
+            resp = self._session.get(url, timeout=10)
             if resp.status_code == 200:
-                card = resp.json()
+                # Decode with orjson when present; resp.json() goes through
+                # the stdlib decoder.
+                card = orjson.loads(resp.content) if orjson is not None else resp.json()
                 return {
                     "oracle_text": card.get("oracle_text", "") or "",
                     "type_line": card.get("type_line", "") or "",
                     "mana_cost": card.get("mana_cost", "") or "",
                 }
         except Exception as exc:  # pragma: no cover - network errors
-            print(f"[ERROR] Failed to fetch card from Scryfall: {exc}")
+            logger.error("Failed to fetch card from Scryfall: %s", exc)
         return None
 
 
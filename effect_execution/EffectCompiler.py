@@ -0,0 +1,121 @@
+# === EffectCompiler.py ===
+"""Ahead-of-time compilation of effect IR into a flat opcode program.
+
+Walking the heterogeneous dict/list IR costs ``isinstance`` checks and
+several ``dict.get`` probes per node on every resolution.  For effects
+that resolve repeatedly (activated abilities, rollout simulations) the
+tree can instead be compiled once into a flat ``array('i')`` of
+``(opcode, operand_index)`` pairs and replayed by the tight VM loop in
+:meth:`EffectEngine.execute_compiled`.
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from typing import Any, List
+
+# Opcodes.  The operand slot of OP_JMP holds the target pc directly; every
+# other opcode's operand indexes into CompiledEffect.operands.
+OP_ACTION = 1  # operand: the leaf effect dict, applied via _apply_action
+OP_IF = 2      # operand: (condition string, pc of the else branch)
+OP_JMP = 3     # operand: target pc
+OP_MODAL = 4   # operand: list of CompiledEffect, one per mode
+OP_REPEAT = 5  # operand: CompiledEffect chain run once per player
+
+
+@dataclass(slots=True)
+class CompiledEffect:
+    """A flattened, replayable effect program."""
+
+    ops: array
+    operands: List[Any]
+
+
+def compile_effect(tree: Any) -> CompiledEffect:
+    """Compile an IR tree into a :class:`CompiledEffect`.
+
+    The structural checks (node kind, which keys are present) are paid
+    here, once, instead of on every resolution.
+    """
+    ops: array = array("i")
+    operands: List[Any] = []
+    _emit(tree, ops, operands)
+    return CompiledEffect(ops=ops, operands=operands)
+
+
+def compiled_for(card: Any) -> CompiledEffect:
+    """Return (and cache on ``card`` when possible) its compiled effect."""
+    cached = getattr(card, "_compiled_effect", None)
+    if cached is not None:
+        return cached
+    compiled = compile_effect(getattr(card, "behavior_tree", None))
+    try:
+        card._compiled_effect = compiled
+    except (AttributeError, TypeError):
+        pass
+    return compiled
+
+
+def _emit(node: Any, ops: array, operands: List[Any]) -> None:
+    if node is None:
+        return
+
+    if isinstance(node, list):
+        for child in node:
+            _emit(child, ops, operands)
+        return
+
+    if not isinstance(node, dict):
+        return
+
+    if node.get("type") == "conditional":
+        # OP_IF falls through into the then-branch and jumps to the else
+        # branch when the condition fails; the then-branch ends with an
+        # OP_JMP over the else code.  Both targets are backpatched.
+        if_operand = [node.get("condition", ""), -1]
+        operands.append(if_operand)
+        ops.append(OP_IF)
+        ops.append(len(operands) - 1)
+        _emit(node.get("then"), ops, operands)
+        ops.append(OP_JMP)
+        jmp_slot = len(ops)
+        ops.append(-1)
+        if_operand[1] = len(ops)
+        _emit(node.get("else"), ops, operands)
+        ops[jmp_slot] = len(ops)
+        return
+
+    if node.get("modal_choices"):
+        operands.append([compile_effect(choice) for choice in node["modal_choices"]])
+        ops.append(OP_MODAL)
+        ops.append(len(operands) - 1)
+        return
+
+    if node.get("repeat"):
+        operands.append(compile_effect(node.get("effect_chain", [])))
+        ops.append(OP_REPEAT)
+        ops.append(len(operands) - 1)
+        return
+
+    if node.get("effect_chain") is not None:
+        for child in node.get("effect_chain", []):
+            _emit(child, ops, operands)
+        return
+
+    if node.get("action"):
+        operands.append(node)
+        ops.append(OP_ACTION)
+        ops.append(len(operands) - 1)
+
+
+__all__ = [
+    "CompiledEffect",
+    "compile_effect",
+    "compiled_for",
+    "OP_ACTION",
+    "OP_IF",
+    "OP_JMP",
+    "OP_MODAL",
+    "OP_REPEAT",
+]
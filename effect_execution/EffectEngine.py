@@ -10,30 +10,131 @@ an :class:`EffectContext` that stores resolution state.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from contextlib import nullcontext
+from dataclasses import InitVar, dataclass, field
 from typing import Any, Dict, List, Optional
 
+from .EffectCompiler import (
+    CompiledEffect,
+    OP_ACTION,
+    OP_IF,
+    OP_JMP,
+    OP_MODAL,
+    OP_REPEAT,
+)
+
+
+# Damage-capability bits: what a target object can soak damage with.
+CAP_LIFE = 1
+CAP_DAMAGE = 2
+CAP_LOYALTY = 4
+
+
+def _target_caps(tgt: Any) -> int:
+    """Return (and cache when possible) the capability bits for ``tgt``.
+
+    ``hasattr`` probes cost a getattr plus exception handling in CPython;
+    computing the mask once and re-reading a cached int keeps repeated
+    damage resolution against the same objects cheap.  Objects with
+    ``__slots__`` can't take the cache attribute and are simply recomputed.
+    """
+    caps = getattr(tgt, "_caps", None)
+    if caps is not None:
+        return caps
+    caps = (
+        hasattr(tgt, "life") * CAP_LIFE
+        | hasattr(tgt, "damage") * CAP_DAMAGE
+        | hasattr(tgt, "loyalty") * CAP_LOYALTY
+    )
+    try:
+        tgt._caps = caps
+    except (AttributeError, TypeError):
+        pass
+    return caps
+
+
+# Reference tags ("that creature", "the exiled card", ...) mapped to dense
+# integer ids, shared process-wide.  The set of distinct tags is tiny and
+# fixed by the parser, so ids stay small and reference storage can be a
+# flat list indexed by id instead of a string-hashed dict per context.
+_TAG_REGISTRY: Dict[str, int] = {}
+
+
+def _tag_id(tag: str) -> int:
+    """Return the stable integer id for ``tag``, registering it if new."""
+    tag_id = _TAG_REGISTRY.get(tag)
+    if tag_id is None:
+        tag_id = _TAG_REGISTRY[tag] = len(_TAG_REGISTRY)
+    return tag_id
+
+
+# Condition flag bits: which truthy phrases a condition string contains.
+# The raw string is kept on the IR node for debug logging; evaluation
+# only ever consults the bitmask.
+COND_IF_YOU_DO = 1
+COND_IF_THEY_CANT = 2
+COND_NISSA_CONTROLLED = 4
+_COND_TRUTHY_MASK = COND_IF_YOU_DO | COND_IF_THEY_CANT | COND_NISSA_CONTROLLED
+
+_COND_PHRASES = (
+    ("if you do", COND_IF_YOU_DO),
+    ("if you discarded", COND_IF_YOU_DO),
+    ("if they can't", COND_IF_THEY_CANT),
+    ("you control a nissa", COND_NISSA_CONTROLLED),
+)
+
+# condition string -> flag bitmask, shared process-wide.  The parser
+# interns conditions, so the distinct-key population stays tiny.
+_COND_FLAGS: Dict[str, int] = {}
+
+
+def _canonicalize_condition(condition: str) -> int:
+    """Return the flag bitmask for ``condition``, computing it at most once.
+
+    The ``lower()`` pass and substring scans run a single time per
+    distinct condition string; every later evaluation is one dict hit
+    and an integer AND instead of an O(n) rescan.
+    """
+    flags = _COND_FLAGS.get(condition)
+    if flags is None:
+        lowered = condition.lower()
+        flags = 0
+        for phrase, bit in _COND_PHRASES:
+            if phrase in lowered:
+                flags |= bit
+        _COND_FLAGS[condition] = flags
+    return flags
+
 
 class DynamicReferenceManager:
     """Manage dynamic references used by pronouns in Oracle text."""
 
+    __slots__ = ("_refs",)
+
     def __init__(self) -> None:
-        self._refs: Dict[str, Any] = {}
+        self._refs: List[Any] = []
 
     def set_reference(self, tag: str, obj: Any) -> None:
         """Store ``obj`` under ``tag`` for later resolution."""
-        self._refs[tag] = obj
+        tag_id = _tag_id(tag)
+        refs = self._refs
+        if tag_id >= len(refs):
+            refs.extend([None] * (tag_id + 1 - len(refs)))
+        refs[tag_id] = obj
 
     def resolve(self, tag: str) -> Any | None:
         """Return the object stored for ``tag`` if present."""
-        return self._refs.get(tag)
+        tag_id = _TAG_REGISTRY.get(tag)
+        if tag_id is None or tag_id >= len(self._refs):
+            return None
+        return self._refs[tag_id]
 
     def clear(self) -> None:
         """Remove all stored references."""
         self._refs.clear()
 
 
-@dataclass
+@dataclass(slots=True)
 class EffectContext:
     """Container for per-resolution state.
 
@@ -53,15 +154,27 @@ class EffectContext:
         Pending zone transitions created by the effect.
     game_state:
         Optional :class:`GameState` instance for direct state manipulation.
+    verbose:
+        When ``False`` no log lines are formatted at all — most of
+        ``_apply_action``'s work is logging, so batch simulations that
+        discard the text should clear this.
     """
 
-    source: Any
-    controller: Any
+    source: Any = None
+    controller: Any = None
     targets: List[Any] = field(default_factory=list)
     dynamic_refs: DynamicReferenceManager = field(default_factory=DynamicReferenceManager)
     flags: Dict[str, Any] = field(default_factory=dict)
     zone_changes: List[Dict[str, Any]] = field(default_factory=list)
     game_state: Any | None = None
+    verbose: bool = True
+    #: Legacy alias from the pre-merge EffectExecutor API; callers that
+    #: still pass ``source_card=`` get it mapped onto ``source``.
+    source_card: InitVar[Any] = None
+
+    def __post_init__(self, source_card: Any) -> None:
+        if self.source is None and source_card is not None:
+            self.source = source_card
 
 
 class EffectEngine:
@@ -73,173 +186,345 @@ class EffectEngine:
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
-    def execute(self, effect_ir: Any, context: EffectContext) -> str:
+    def execute(self, effect_ir: Any, context: EffectContext, game_state: Any | None = None) -> str:
         """Execute ``effect_ir`` using ``context``.
 
-        ``effect_ir`` may be a single action node or a nested behavior tree
-        consisting of lists and dictionaries.  The engine walks the
-        structure recursively and applies game state mutations.
-        Returns a human readable summary of the actions performed.
+        ``effect_ir`` may be a single action node, a nested behavior tree
+        of lists and dictionaries, or a pre-compiled
+        :class:`~effect_execution.EffectCompiler.CompiledEffect`.
+        ``game_state`` is accepted positionally for callers of the old
+        ``EffectExecutor.execute(ir, ctx, state)`` convention and is
+        folded into the context.  Returns a human readable summary of
+        the actions performed.
         """
+        if game_state is not None and context.game_state is None:
+            context.game_state = game_state
+        if isinstance(effect_ir, CompiledEffect):
+            return self.execute_compiled(effect_ir, context)
         return self._walk(effect_ir, context)
 
+    def execute_compiled(self, compiled: CompiledEffect, context: EffectContext) -> str:
+        """Replay a compiled effect program; see ``EffectCompiler``."""
+        out: List[str] = []
+        self._run_ops(compiled, context, out)
+        return "\n".join(out)
+
+    def _run_ops(self, compiled: CompiledEffect, context: EffectContext, out: List[str]) -> None:
+        """Tight VM loop over the flat (opcode, operand) pairs."""
+        ops = compiled.ops
+        operands = compiled.operands
+        pc = 0
+        n = len(ops)
+        while pc < n:
+            op = ops[pc]
+            arg = ops[pc + 1]
+            pc += 2
+            if op == OP_ACTION:
+                self._apply_action(operands[arg], context, out)
+            elif op == OP_IF:
+                condition, else_pc = operands[arg]
+                if not self._evaluate_condition(condition, context):
+                    pc = else_pc
+            elif op == OP_JMP:
+                pc = arg
+            elif op == OP_MODAL:
+                choices = operands[arg]
+                index = context.flags.get("modal_choice", 0)
+                if 0 <= index < len(choices):
+                    self._run_ops(choices[index], context, out)
+            elif op == OP_REPEAT:
+                gs = context.game_state
+                players = getattr(gs, "players", None) or [context.controller]
+                chain = operands[arg]
+                for _ in players:
+                    self._run_ops(chain, context, out)
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
-    def _walk(self, node: Any, context: EffectContext) -> str:
-        if node is None:
-            return ""
+    def _walk(self, root: Any, context: EffectContext) -> str:
+        """Iteratively traverse an IR tree, applying leaf actions in order.
 
-        if isinstance(node, list):
-            logs = [self._walk(child, context) for child in node]
-            return "\n".join(l for l in logs if l)
+        An explicit stack replaces recursion: no call-frame per IR node and
+        no RecursionError on pathologically nested chains.  Children are
+        pushed in reverse so pop order matches the original left-to-right
+        resolution order.
+        """
+        out: List[str] = []
+        stack: List[Any] = [root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+
+            if isinstance(node, list):
+                stack.extend(reversed(node))
+                continue
 
-        if isinstance(node, dict):
-            # Conditional branches
+            if not isinstance(node, dict):
+                continue
+
+            # Conditional branches: evaluate inline, walk only the taken arm.
             if node.get("type") == "conditional":
                 condition = node.get("condition", "")
                 if self._evaluate_condition(condition, context):
-                    return self._walk(node.get("then"), context)
-                return self._walk(node.get("else"), context)
+                    stack.append(node.get("then"))
+                else:
+                    stack.append(node.get("else"))
+                continue
 
             # Modal choices
             if node.get("modal_choices"):
                 index = context.flags.get("modal_choice", 0)
                 choices = node.get("modal_choices", [])
                 if 0 <= index < len(choices):
-                    return self._walk(choices[index], context)
-                return ""
+                    stack.append(choices[index])
+                continue
 
-            # Repeat structures
+            # Repeat structures: expand players x effect_chain eagerly.
             if node.get("repeat"):
-                repeat_logs: List[str] = []
                 players: List[Any] = []
                 if context.game_state and hasattr(context.game_state, "players"):
                     players = context.game_state.players
                 if not players:
                     players = [context.controller]
-                for _ in players:
-                    for child in node.get("effect_chain", []):
-                        repeat_logs.append(self._walk(child, context))
-                return "\n".join(l for l in repeat_logs if l)
+                chain = node.get("effect_chain", [])
+                stack.extend(reversed(chain * len(players)))
+                continue
 
             # Effect chains
             if node.get("effect_chain") is not None:
-                logs = [self._walk(eff, context) for eff in node.get("effect_chain", [])]
-                return "\n".join(l for l in logs if l)
+                stack.extend(reversed(node.get("effect_chain", [])))
+                continue
 
             # Single action
             if node.get("action"):
-                return self._apply_action(node, context)
+                self._apply_action(node, context, out)
 
-        return ""
+        return "\n".join(out)
 
-    def _apply_action(self, effect: Dict[str, Any], context: EffectContext) -> str:
-        action = effect.get("action", "unknown_effect")
-        amount = effect.get("amount", 0)
+    def _apply_action(self, effect: Dict[str, Any], context: EffectContext, out: List[str]) -> None:
+        """Apply one leaf action, appending log lines to ``out``.
+
+        Handlers write straight into the walk-owned buffer: one list for
+        the whole resolution instead of a fresh list plus join per action.
+        """
+        # Destructure the node once up front: locals are LOAD_FAST reads,
+        # each repeated .get a hashed dict lookup.
+        get = effect.get
+        action = get("action", "unknown_effect")
+        amount = get("amount")
+        reference_tag = get("reference_tag")
 
         # Resolve dynamic reference tags
-        if "reference_tag" in effect and "target_resolved" not in effect:
-            ref_obj = context.dynamic_refs.resolve(effect["reference_tag"])
+        if reference_tag is not None and "target_resolved" not in effect:
+            ref_obj = context.dynamic_refs.resolve(reference_tag)
             if ref_obj is not None:
                 effect["target_resolved"] = ref_obj
 
-        target = effect.get("target_resolved") or effect.get("target")
+        target = get("target_resolved") or get("target")
         targets = target if isinstance(target, list) else [target] if target else []
 
-        logs: List[str] = []
-        gs = context.game_state
+        # One dict probe instead of walking an if/elif ladder of string
+        # compares for every resolved leaf effect.
+        handler = self._ACTION_HANDLERS.get(action, EffectEngine._do_unknown)
+        handler(self, effect, context, targets, amount, out)
 
-        if action == "draw_card":
-            if hasattr(context.controller, "draw"):
-                count = effect.get("amount", 1)
-                context.controller.draw(count)
-                logs.append(f"{context.controller.name} draws {count} card(s).")
-
-        elif action == "gain_life":
-            if hasattr(context.controller, "gain_life"):
-                amt = effect.get("amount", 1)
-                context.controller.gain_life(amt)
-                logs.append(f"{context.controller.name} gains {amt} life.")
-
-        elif action == "lose_life":
-            if hasattr(context.controller, "lose_life"):
-                amt = effect.get("amount", 1)
-                context.controller.lose_life(amt)
-                logs.append(f"{context.controller.name} loses {amt} life.")
-
-        elif action == "deal_damage":
+    # ------------------------------------------------------------------
+    # Action handlers (one per IR action name)
+    # ------------------------------------------------------------------
+    def _do_draw_card(self, effect, context, targets, amount, out) -> None:
+        if hasattr(context.controller, "draw"):
+            count = 1 if amount is None else amount
+            context.controller.draw(count)
+            if context.verbose:
+                out.append(f"{context.controller.name} draws {count} card(s).")
+
+    def _do_gain_life(self, effect, context, targets, amount, out) -> None:
+        if hasattr(context.controller, "gain_life"):
+            amt = 1 if amount is None else amount
+            context.controller.gain_life(amt)
+            if context.verbose:
+                out.append(f"{context.controller.name} gains {amt} life.")
+
+    def _do_lose_life(self, effect, context, targets, amount, out) -> None:
+        if hasattr(context.controller, "lose_life"):
+            amt = 1 if amount is None else amount
+            context.controller.lose_life(amt)
+            mark_dirty = getattr(context.game_state, "mark_dirty", None)
+            if mark_dirty is not None:
+                mark_dirty(context.controller)
+            if context.verbose:
+                out.append(f"{context.controller.name} loses {amt} life.")
+
+    def _do_deal_damage(self, effect, context, targets, amount, out) -> None:
+        if amount is None:
+            amount = 0
+        # Multi-target damage should land as one transaction: deferring
+        # the SBA pass until every target is mutated turns O(targets)
+        # battlefield walks into one.
+        gs = context.game_state
+        batch = getattr(gs, "batch", None)
+        mark_dirty = getattr(gs, "mark_dirty", None)
+        with batch() if batch is not None and len(targets) > 1 else nullcontext():
+            if len(targets) > 8:
+                self._bulk_damage(targets, amount, out if context.verbose else None,
+                                  mark_dirty)
+                return
+            verbose = context.verbose
             for tgt in targets:
                 if tgt is None:
                     continue
-                if hasattr(tgt, "life"):
+                if mark_dirty is not None:
+                    mark_dirty(tgt)
+                caps = _target_caps(tgt)
+                if caps & CAP_LIFE:
                     tgt.life -= amount
-                    logs.append(f"{tgt.name} takes {amount} damage (life).")
-                elif hasattr(tgt, "damage"):
+                    if verbose:
+                        out.append(f"{tgt.name} takes {amount} damage (life).")
+                elif caps & CAP_DAMAGE:
                     tgt.damage += amount
-                    logs.append(f"{tgt.name} takes {amount} damage (marked).")
-                elif hasattr(tgt, "loyalty"):
+                    if verbose:
+                        out.append(f"{tgt.name} takes {amount} damage (marked).")
+                elif caps & CAP_LOYALTY:
                     tgt.loyalty -= amount
-                    logs.append(f"{tgt.name} loses {amount} loyalty.")
-
-        elif action == "grant_keyword":
-            logs.append(f"Keyword granted: {effect.get('keyword')}")
-
-        elif action == "create_token":
-            logs.append(f"Token created: {effect.get('token')}")
-            if tag := effect.get("store_as"):
-                context.dynamic_refs.set_reference(tag, effect.get("token"))
-
-        elif action == "apply_pt_modifier":
-            logs.append(f"Applied P/T modifier: {effect.get('mod')} until end of turn")
-
-        elif action == "search_library":
-            logs.append(f"Searching library (reveal: {effect.get('reveal')})")
-
-        elif action == "discard_cards":
-            logs.append(f"Discarding {effect.get('amount')} cards")
-
-        elif action == "exile_from_hand":
-            logs.append("Exiling card from opponent's hand")
-
-        elif action == "multi_player_discard":
-            logs.append("Each opponent discards a card")
-
-        elif action == "untap_permanents":
-            logs.append(f"Untapping up to {effect.get('amount', 1)} permanents")
-
-        elif action == "put_into_library_depth":
-            logs.append(f"Put into library {effect.get('position')} from top")
-
-        elif action == "destroy_target":
+                    if verbose:
+                        out.append(f"{tgt.name} loses {amount} loyalty.")
+
+    @staticmethod
+    def _bulk_damage(targets: List[Any], amount: int, out: List[str] | None,
+                     mark_dirty: Any | None = None) -> None:
+        """Mass-damage path for wide effects (board wipes, "each creature").
+
+        Targets are partitioned by capability first, then each group is
+        mutated in its own tight loop — no per-iteration branch prediction
+        misses, and the log lines are built in one comprehension per group
+        rather than interleaved with the state writes.
+        """
+        life_tgts: List[Any] = []
+        dmg_tgts: List[Any] = []
+        loy_tgts: List[Any] = []
+        for tgt in targets:
+            if tgt is None:
+                continue
+            if mark_dirty is not None:
+                mark_dirty(tgt)
+            caps = _target_caps(tgt)
+            if caps & CAP_LIFE:
+                life_tgts.append(tgt)
+            elif caps & CAP_DAMAGE:
+                dmg_tgts.append(tgt)
+            elif caps & CAP_LOYALTY:
+                loy_tgts.append(tgt)
+        for tgt in life_tgts:
+            tgt.life -= amount
+        for tgt in dmg_tgts:
+            tgt.damage += amount
+        for tgt in loy_tgts:
+            tgt.loyalty -= amount
+        if out is not None:
+            out.extend(f"{t.name} takes {amount} damage (life)." for t in life_tgts)
+            out.extend(f"{t.name} takes {amount} damage (marked)." for t in dmg_tgts)
+            out.extend(f"{t.name} loses {amount} loyalty." for t in loy_tgts)
+
+    def _do_grant_keyword(self, effect, context, targets, amount, out) -> None:
+        if not context.verbose:
+            return
+        out.append(f"Keyword granted: {effect.get('keyword')}")
+
+    def _do_create_token(self, effect, context, targets, amount, out) -> None:
+        if tag := effect.get("store_as"):
+            context.dynamic_refs.set_reference(tag, effect.get("token"))
+        if context.verbose:
+            out.append(f"Token created: {effect.get('token')}")
+
+    def _do_apply_pt_modifier(self, effect, context, targets, amount, out) -> None:
+        if not context.verbose:
+            return
+        out.append(f"Applied P/T modifier: {effect.get('mod')} until end of turn")
+
+    def _do_search_library(self, effect, context, targets, amount, out) -> None:
+        if not context.verbose:
+            return
+        out.append(f"Searching library (reveal: {effect.get('reveal')})")
+
+    def _do_discard_cards(self, effect, context, targets, amount, out) -> None:
+        if not context.verbose:
+            return
+        out.append(f"Discarding {effect.get('amount')} cards")
+
+    def _do_exile_from_hand(self, effect, context, targets, amount, out) -> None:
+        if not context.verbose:
+            return
+        out.append("Exiling card from opponent's hand")
+
+    def _do_multi_player_discard(self, effect, context, targets, amount, out) -> None:
+        if not context.verbose:
+            return
+        out.append("Each opponent discards a card")
+
+    def _do_untap_permanents(self, effect, context, targets, amount, out) -> None:
+        if not context.verbose:
+            return
+        out.append(f"Untapping up to {effect.get('amount', 1)} permanents")
+
+    def _do_put_into_library_depth(self, effect, context, targets, amount, out) -> None:
+        if not context.verbose:
+            return
+        out.append(f"Put into library {effect.get('position')} from top")
+
+    def _do_destroy_target(self, effect, context, targets, amount, out) -> None:
+        gs = context.game_state
+        # Bind the loop invariants once: the bound method, the fallback
+        # controller and the verbose flag are attribute reads per target
+        # otherwise.
+        move_card = getattr(gs, "move_card", None)
+        default_controller = context.controller
+        verbose = context.verbose
+        batch = getattr(gs, "batch", None)
+        with batch() if batch is not None and len(targets) > 1 else nullcontext():
             for tgt in targets:
                 if tgt is None:
                     continue
-                if gs and hasattr(gs, "move_card"):
-                    owner = getattr(tgt, "controller", context.controller)
-                    gs.move_card(tgt, owner, "graveyard")
-                logs.append(f"Destroying target: {getattr(tgt, 'name', tgt)}")
-
-        elif action == "conditional_fallback":
-            logs.append("[INFO] Conditional fallback detected")
-
-        else:
-            logs.append("[UNKNOWN EFFECT]")
-            logs.append(f"  Action: {action}")
-            logs.append(f"  Raw Text: {effect.get('raw_text', '<missing raw_text>')}")
-            logs.append(f"  Full Effect: {effect}")
-
-        return "\n".join(logs)
-
-    def _evaluate_condition(self, condition: str, _context: EffectContext) -> bool:
-        condition = condition.lower()
-        if "if you do" in condition or "if you discarded" in condition:
-            return True
-        if "if they can't" in condition:
-            return True
-        if "you control a nissa" in condition:
-            return True
-        return False
+                if move_card is not None:
+                    owner = getattr(tgt, "controller", default_controller)
+                    move_card(tgt, owner, "graveyard")
+                if verbose:
+                    out.append(f"Destroying target: {getattr(tgt, 'name', tgt)}")
+
+    def _do_conditional_fallback(self, effect, context, targets, amount, out) -> None:
+        if not context.verbose:
+            return
+        out.append("[INFO] Conditional fallback detected")
+
+    def _do_unknown(self, effect, context, targets, amount, out) -> None:
+        out.append("[UNKNOWN EFFECT]")
+        out.append(f"  Action: {effect.get('action', 'unknown_effect')}")
+        out.append(f"  Raw Text: {effect.get('raw_text', '<missing raw_text>')}")
+        out.append(f"  Full Effect: {effect}")
+
+    #: Built once at class-definition time; maps IR action names to the
+    #: unbound handler functions above.
+    _ACTION_HANDLERS: Dict[str, Any] = {
+        "draw_card": _do_draw_card,
+        "gain_life": _do_gain_life,
+        "lose_life": _do_lose_life,
+        "deal_damage": _do_deal_damage,
+        "grant_keyword": _do_grant_keyword,
+        "create_token": _do_create_token,
+        "apply_pt_modifier": _do_apply_pt_modifier,
+        "search_library": _do_search_library,
+        "discard_cards": _do_discard_cards,
+        "exile_from_hand": _do_exile_from_hand,
+        "multi_player_discard": _do_multi_player_discard,
+        "untap_permanents": _do_untap_permanents,
+        "put_into_library_depth": _do_put_into_library_depth,
+        "destroy_target": _do_destroy_target,
+        "conditional_fallback": _do_conditional_fallback,
+    }
+
+    def _evaluate_condition(self, condition: str, context: EffectContext) -> bool:
+        return (_canonicalize_condition(condition) & _COND_TRUTHY_MASK) != 0
 
 
 __all__ = ["EffectEngine", "EffectContext", "DynamicReferenceManager"]
@@ -1,5 +1,11 @@
 # === ReplacementEffectManager ===
 class ReplacementEffect:
+    __slots__ = ()
+
+    #: Event types this effect can ever apply to.  ``None`` means the
+    #: effect must be offered every event (wildcard).
+    event_types = None
+
     def applies(self, event):
         return False
 
@@ -9,12 +15,28 @@ class ReplacementEffect:
 class ReplacementEffectManager:
     def __init__(self):
         self.effects = []
+        # Effects indexed by the event types they declared interest in;
+        # apply_replacements then touches only the handful of effects
+        # that can match instead of scanning every registered effect
+        # for every event fired.
+        self._by_type = {}
+        self._wildcards = []
 
     def register(self, effect):
         self.effects.append(effect)
+        event_types = getattr(effect, "event_types", None)
+        if not event_types:
+            self._wildcards.append(effect)
+            return
+        for event_type in event_types:
+            self._by_type.setdefault(event_type, []).append(effect)
 
     def apply_replacements(self, event):
-        for effect in self.effects:
+        event_type = getattr(event, "event_type", None)
+        for effect in self._by_type.get(event_type, ()):
+            if effect.applies(event):
+                event = effect.replace(event)
+        for effect in self._wildcards:
             if effect.applies(event):
                 event = effect.replace(event)
         return event
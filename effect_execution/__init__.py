@@ -1,5 +1,6 @@
 # === effect_execution Anchor Module ===
 
 from .EffectEngine import EffectEngine, EffectContext, DynamicReferenceManager
+from .EffectCompiler import CompiledEffect, compile_effect, compiled_for
 from .StaticChecker import StaticChecker
 from .ReplacementEffectManager import ReplacementEffectManager
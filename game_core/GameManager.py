@@ -1,4 +1,5 @@
 # === GameManager ===
+from .GameState import GameState
 from .PriorityManager import PriorityManager
 from stack_system.TriggerEngine import TriggerEngine
 from stack_system.StackEngine import StackEngine
@@ -10,28 +11,52 @@ from .StateMemoryTracker import StateMemoryTracker
 class SimplePhaseManager:
     """Fallback phase manager using :class:`GameState` phase order."""
 
+    __slots__ = ("phases", "_n", "current_index")
+
     def __init__(self, phases):
-        self.phases = list(phases)
+        self.phases = tuple(phases)
+        self._n = len(self.phases)
         self.current_index = 0
 
     def current_phase(self):
         return self.phases[self.current_index]
 
     def next_phase(self):
-        self.current_index = (self.current_index + 1) % len(self.phases)
+        # Compare-and-reset: cheaper than a len() call plus modulo per
+        # step, and perfectly predictable in the turn loop.
+        i = self.current_index + 1
+        self.current_index = 0 if i == self._n else i
 
 
 class DefaultStateBasedActions:
     """Minimal SBA handler that defers to ``GameState.check_state_based_actions``."""
 
+    __slots__ = ()
+
     def check_and_apply(self, game_state):
         return game_state.check_state_based_actions()
 
 class GameManager:
+    __slots__ = (
+        "players",
+        "phase_manager",
+        "priority_manager",
+        "trigger_engine",
+        "state_based_actions",
+        "stack",
+        "turn_player_index",
+        "headless_mode",
+        "_log",
+        "_phase_handlers",
+        "_cleanup_index",
+        "_cp_index",
+        "_cp_untap_all",
+        "_cp_draw",
+    )
+
     def __init__(self, players, stack, phase_manager, trigger_engine, priority_manager=None, state_based_actions=None, headless=False):
         self.players = players
         if phase_manager is None:
-            from .GameState import GameState
             self.phase_manager = SimplePhaseManager(GameState.phases)
         else:
             self.phase_manager = phase_manager
@@ -42,6 +67,27 @@ class GameManager:
         self.stack = stack
         self.turn_player_index = 0
         self.headless_mode = headless
+        # Bound once: headless runs swap stdout for a noop so the hot
+        # loop never acquires the stdout lock or formats output.
+        self._log = (lambda *args, **kwargs: None) if headless else print
+        # Turn-based actions per phase, resolved by one dict probe
+        # instead of a chain of string compares; phases without an
+        # action simply miss.
+        self._phase_handlers = {
+            "Untap": GameManager._run_untap,
+            "Draw": GameManager._run_draw,
+        }
+        self._cp_index = -1
+        self._bind_turn_player()
+        # Where Cleanup sits in the phase order, so the turn loop can
+        # compare indices instead of phase strings.  None when a custom
+        # phase manager doesn't expose an index.
+        phases = getattr(self.phase_manager, "phases", None)
+        self._cleanup_index = (
+            phases.index("Cleanup")
+            if phases and hasattr(self.phase_manager, "current_index")
+            else None
+        )
 
     def resolve_stack(self) -> str:
         """Convenience wrapper to resolve the top of the stack."""
@@ -53,60 +99,105 @@ class GameManager:
     def next_turn(self):
         self.turn_player_index = (self.turn_player_index + 1) % len(self.players)
         self.phase_manager.current_index = 0
+        self._bind_turn_player()
+
+    def _bind_turn_player(self):
+        """Cache the turn player's phase methods as bound references.
+
+        The turn player only changes between turns, so constructing the
+        bound methods here keeps the per-phase handlers to a plain call.
+        The handlers still re-bind lazily if the index was moved from
+        outside (the UI writes turn_player_index directly).
+        """
+        player = self.players[self.turn_player_index]
+        self._cp_index = self.turn_player_index
+        self._cp_untap_all = player.untap_all
+        self._cp_draw = player.draw
+
+    def _run_untap(self):
+        if self._cp_index != self.turn_player_index:
+            self._bind_turn_player()
+        self._cp_untap_all()
+
+    def _run_draw(self):
+        if self._cp_index != self.turn_player_index:
+            self._bind_turn_player()
+        self._cp_draw(1)
 
     def execute_phase(self, game_state):
-        phase = self.phase_manager.current_phase()
-        print(f"== {phase} ==")
-
-        if phase == "Untap":
-            self.current_player().untap_all()
-        elif phase == "Draw":
-            self.current_player().draw(1)
-
-        self.trigger_engine.check_and_push(game_state, self.stack)
-        self.state_based_actions.check_and_apply(game_state)
+        # Bind the participants of the priority loop once; each LOAD_FAST
+        # below replaces an attribute dict lookup per iteration.
+        pm = self.priority_manager
+        stack = self.stack
+        phase_manager = self.phase_manager
+        pass_priority = pm.pass_priority
+        reset = pm.reset
+        is_empty = stack.is_empty
+        resolve_top = stack.resolve_top
+        check_and_push = self.trigger_engine.check_and_push
+        check_and_apply = self.state_based_actions.check_and_apply
+        log = self._log
+
+        phase = phase_manager.current_phase()
+        if not self.headless_mode:
+            # Guarded rather than routed through log() so the banner
+            # string is never formatted when it would be discarded.
+            log(f"== {phase} ==")
+
+        handler = self._phase_handlers.get(phase)
+        if handler is not None:
+            handler(self)
+
+        check_and_push(game_state, stack)
+        check_and_apply(game_state)
 
         if self.headless_mode:
-            self.priority_manager.pass_priority()
-            if self.priority_manager.both_players_passed():
-                if not self.stack.is_empty():
-                    print("Resolving top of stack...")
-                    print(self.stack.resolve_top(game_state))
-                    self.trigger_engine.check_and_push(game_state, self.stack)
-                    self.state_based_actions.check_and_apply(game_state)
-                    self.priority_manager.reset()
+            pass_priority()
+            if pm.both_players_passed():
+                if not is_empty():
+                    log("Resolving top of stack...")
+                    log(resolve_top(game_state))
+                    check_and_push(game_state, stack)
+                    check_and_apply(game_state)
+                    reset()
                     return
                 else:
-                    self.phase_manager.next_phase()
-                    self.priority_manager.reset()
+                    phase_manager.next_phase()
+                    reset()
                     return
             return
 
         while True:
-            if self.priority_manager.pass_priority():
-                if not self.stack.is_empty():
-                    print("Resolving top of stack...")
-                    print(self.stack.resolve_top(game_state))
-                    self.trigger_engine.check_and_push(game_state, self.stack)
-                    self.state_based_actions.check_and_apply(game_state)
-                    self.priority_manager.reset()
+            if pass_priority():
+                if not is_empty():
+                    log("Resolving top of stack...")
+                    log(resolve_top(game_state))
+                    check_and_push(game_state, stack)
+                    check_and_apply(game_state)
+                    reset()
                     continue
                 else:
-                    self.phase_manager.next_phase()
-                    self.priority_manager.reset()
+                    phase_manager.next_phase()
+                    reset()
                     break
 
     def execute_turn(self, game_state):
-        while self.phase_manager.current_phase() != "Cleanup":
-            self.execute_phase(game_state)
-        self.phase_manager.next_phase()
+        phase_manager = self.phase_manager
+        cleanup_index = self._cleanup_index
+        if cleanup_index is not None:
+            while phase_manager.current_index != cleanup_index:
+                self.execute_phase(game_state)
+        else:
+            current_phase = phase_manager.current_phase
+            while current_phase() != "Cleanup":
+                self.execute_phase(game_state)
+        phase_manager.next_phase()
         self.next_turn()
 
 
     def run(self, game_state=None):
         """Execute turns indefinitely using ``game_state``."""
         if game_state is None:
-            from .GameState import GameState
             game_state = GameState(self.players, stack=self.stack, trigger_engine=self.trigger_engine)
         try:
             while True:
@@ -7,11 +7,58 @@ modules by providing a single object that the rest of the engine can
 query and mutate.
 """
 
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from enum import StrEnum
 from typing import List, Dict, Any
 
 from stack_system.StackEngine import StackEngine
 
 
+class Phase(StrEnum):
+    """Turn phases in order.
+
+    Members are strings, so existing ``phase == "Untap"`` comparisons and
+    log formatting keep working unchanged, while hot paths can use identity
+    checks (``phase is Phase.DECLARE_ATTACKERS``) — a single pointer compare
+    instead of a string hash and memcmp per call.
+    """
+
+    UNTAP = "Untap"
+    UPKEEP = "Upkeep"
+    DRAW = "Draw"
+    PRECOMBAT_MAIN = "Precombat Main"
+    BEGINNING_OF_COMBAT = "Beginning of Combat"
+    DECLARE_ATTACKERS = "Declare Attackers"
+    DECLARE_BLOCKERS = "Declare Blockers"
+    COMBAT_DAMAGE = "Combat Damage"
+    END_OF_COMBAT = "End of Combat"
+    POSTCOMBAT_MAIN = "Postcombat Main"
+    END_STEP = "End Step"
+    CLEANUP = "Cleanup"
+
+
+@dataclass
+class Combat:
+    """Current combat assignments, always present on :class:`GameState`.
+
+    Having the struct exist from ``__init__`` onward lets combat code read
+    ``game_state.combat.attackers`` unconditionally instead of probing with
+    ``hasattr`` and chaining dict lookups.
+    """
+
+    attackers: Dict[Any, Any] = field(default_factory=dict)
+    # defaultdict so recording a block is one lookup + append rather than
+    # a setdefault that allocates a throwaway list on every hit.
+    blockers: Dict[Any, List[Any]] = field(default_factory=lambda: defaultdict(list))
+
+    def clear(self) -> None:
+        """Reset assignments at end of combat."""
+        self.attackers.clear()
+        self.blockers.clear()
+
+
 class GameState:
     """Container object holding all mutable game information.
 
@@ -26,20 +73,17 @@ class GameState:
         Optional trigger engine used when moving cards to the battlefield.
     """
 
-    phases = [
-        "Untap",
-        "Upkeep",
-        "Draw",
-        "Precombat Main",
-        "Beginning of Combat",
-        "Declare Attackers",
-        "Declare Blockers",
-        "Combat Damage",
-        "End of Combat",
-        "Postcombat Main",
-        "End Step",
-        "Cleanup",
-    ]
+    phases = tuple(Phase)
+    _phase_count = len(phases)
+
+    #: Zone name -> the SoA attribute holding one list per player.
+    _ZONE_ATTRS = {
+        "hand": "hands",
+        "library": "libraries",
+        "battlefield": "battlefields",
+        "graveyard": "graveyards",
+        "exile": "exiles",
+    }
 
     def __init__(self, players: List[Any] | None = None, stack: StackEngine | None = None, trigger_engine: Any | None = None) -> None:
         self.players: List[Any] = players or []
@@ -48,19 +92,43 @@ class GameState:
 
         self.turn_index: int = 0
         self.phase_index: int = 0
-
-        # Zones are stored per player and mirror the zone lists on the
-        # player objects so that operations remain in sync.
+        self.combat: Combat = Combat()
+        #: Monotonic state-change counter.  Anything that memoizes a
+        #: state-dependent computation keys it on this value.
+        self.version: int = 0
+        #: Open-batch nesting depth; while positive, SBA checks are deferred.
+        self._batch_depth: int = 0
+        #: Objects whose SBA-relevant state changed since the last check,
+        #: keyed by id() so unhashable card dataclasses can be tracked.
+        self._sba_dirty: Dict[int, Any] = {}
+        #: Force one exhaustive sweep on the next check; set at turn
+        #: boundaries as a safety net for unreported mutations.
+        self._sba_full_scan: bool = True
+
+        # Zones are stored structure-of-arrays style: one list of zone
+        # lists per zone name, indexed by a dense player ordinal.  The
+        # lists are shared by reference with the player objects so that
+        # mutations remain in sync, and ``self.zones`` is kept as a
+        # player-keyed compatibility view over the same lists.
+        self._pidx: Dict[Any, int] = {}
+        #: Bound methods to run at each turn start; the hasattr probe is
+        #: paid once when a player registers, not once per turn.
+        self._turn_start_hooks: List[Any] = []
+        self.hands: List[List[Any]] = []
+        self.libraries: List[List[Any]] = []
+        self.battlefields: List[List[Any]] = []
+        self.graveyards: List[List[Any]] = []
+        self.exiles: List[List[Any]] = []
         self.zones: Dict[Any, Dict[str, List[Any]]] = {}
         for p in self.players:
             self.register_player(p)
 
-        # Rules for state based actions
-        self._sba_rules = [
-            {"condition": self._creature_with_zero_toughness, "action": self._destroy_creature},
-            {"condition": self._creature_with_lethal_damage, "action": self._destroy_creature},
-            {"condition": self._player_zero_life, "action": self._player_lose},
-        ]
+        # Rules for state based actions: (condition, action) pairs that
+        # unpack straight into locals, with no dict lookups per rule.
+        self._sba_rules = (
+            (self._creature_dead, self._destroy_creature),
+            (self._player_zero_life, self._player_lose),
+        )
 
     # ------------------------------------------------------------------
     # Player and phase handling
@@ -75,6 +143,28 @@ class GameState:
 
         if player not in self.players:
             self.players.append(player)
+        try:
+            player.game_state = self
+        except AttributeError:
+            pass
+        idx = self._pidx.get(player)
+        if idx is None:
+            self._pidx[player] = len(self._pidx)
+            reset_land_play = getattr(player, "reset_land_play", None)
+            if reset_land_play is not None:
+                self._turn_start_hooks.append(reset_land_play)
+            self.hands.append(player.hand)
+            self.libraries.append(player.library)
+            self.battlefields.append(player.battlefield)
+            self.graveyards.append(player.graveyard)
+            self.exiles.append(player.exile)
+        else:
+            # Re-registration refreshes the shared list references.
+            self.hands[idx] = player.hand
+            self.libraries[idx] = player.library
+            self.battlefields[idx] = player.battlefield
+            self.graveyards[idx] = player.graveyard
+            self.exiles[idx] = player.exile
         self.zones[player] = {
             "hand": player.hand,
             "library": player.library,
@@ -87,22 +177,23 @@ class GameState:
         """Return the player whose turn it currently is."""
         return self.players[self.turn_index]
 
-    def current_phase(self) -> str:
-        """Return the name of the current phase."""
+    def current_phase(self) -> Phase:
+        """Return the current :class:`Phase` (compares equal to its name)."""
         return self.phases[self.phase_index]
 
-    def advance_phase(self) -> str:
-        """Advance to the next phase and return its name."""
-        self.phase_index = (self.phase_index + 1) % len(self.phases)
-        return self.current_phase()
+    def advance_phase(self) -> Phase:
+        """Advance to the next phase and return it."""
+        i = self.phase_index + 1
+        self.phase_index = 0 if i == self._phase_count else i
+        return self.phases[self.phase_index]
 
     def next_turn(self) -> Any:
         """Move to the next player's turn and return that player."""
         self.turn_index = (self.turn_index + 1) % len(self.players)
         self.phase_index = 0
-        for p in self.players:
-            if hasattr(p, "reset_land_play"):
-                p.reset_land_play()
+        self._sba_full_scan = True
+        for hook in self._turn_start_hooks:
+            hook()
         return self.current_player()
 
     # ------------------------------------------------------------------
@@ -110,12 +201,39 @@ class GameState:
     # ------------------------------------------------------------------
     def get_zone(self, player: Any, zone_type: str) -> List[Any]:
         """Return the requested zone list for ``player``."""
-        if player not in self.zones:
+        idx = self._pidx.get(player)
+        if idx is None:
             raise ValueError("Player not managed by this GameState")
-        try:
-            return self.zones[player][zone_type]
-        except KeyError as exc:
-            raise ValueError(f"Unknown zone: {zone_type}") from exc
+        attr = self._ZONE_ATTRS.get(zone_type)
+        if attr is None:
+            raise ValueError(f"Unknown zone: {zone_type}")
+        return getattr(self, attr)[idx]
+
+    @staticmethod
+    def _invalidate_battlefield_views(player: Any) -> None:
+        """Tell ``player`` its typed battlefield views are stale.
+
+        A plain length compare on the battlefield list cannot see an
+        equal-count remove+add, so every battlefield-touching move
+        reports itself here.  Stand-in players without the hook are
+        simply skipped.
+        """
+        invalidate = getattr(player, "_invalidate_battlefield_views", None)
+        if invalidate is not None:
+            invalidate()
+
+    @staticmethod
+    def _note_hand_change(player: Any, card: Any, gained: bool) -> None:
+        """Tell ``player`` its hand gained or lost ``card``.
+
+        The castable-spell cache is keyed by a hand version counter that
+        only Player's own mutators bump, so zone moves through here must
+        report as well (they also keep the hand id-set current).
+        Stand-in players without the hooks are simply skipped.
+        """
+        hook = getattr(player, "_note_hand_gain" if gained else "_note_hand_loss", None)
+        if hook is not None:
+            hook(card)
 
     def move_card(self, card: Any, player: Any, new_zone: str, face_down: bool = False) -> str:
         """Move ``card`` to ``player``'s ``new_zone``.
@@ -127,22 +245,61 @@ class GameState:
         will be registered automatically.
         """
 
-        if player not in self.zones:
+        idx = self._pidx.get(player)
+        if idx is None:
             raise ValueError("Player not managed by this GameState")
-        if new_zone not in self.zones[player]:
+        attr = self._ZONE_ATTRS.get(new_zone)
+        if attr is None:
             raise ValueError(f"Unknown zone: {new_zone}")
 
-        # Remove from current zone, regardless of owner
-        for zones in self.zones.values():
-            for lst in zones.values():
+        # Remove from current zone.  The card's own back-references name
+        # its containing list, so the common case is one dict hit plus a
+        # single list.remove; the exhaustive every-player-every-zone scan
+        # only runs when those back-references are stale.
+        removed = False
+        old_controller = getattr(card, "controller", None)
+        owner_idx = self._pidx.get(old_controller)
+        if owner_idx is not None:
+            owner_attr = self._ZONE_ATTRS.get(getattr(card, "zone", None))
+            if owner_attr is not None:
+                lst = getattr(self, owner_attr)[owner_idx]
                 if card in lst:
                     lst.remove(card)
+                    removed = True
+                    if owner_attr == "battlefields":
+                        self._invalidate_battlefield_views(old_controller)
+                    elif owner_attr == "hands":
+                        self._note_hand_change(old_controller, card, False)
+        if not removed:
+            for zone_attr in self._ZONE_ATTRS.values():
+                for pos, lst in enumerate(getattr(self, zone_attr)):
+                    if card in lst:
+                        lst.remove(card)
+                        if zone_attr == "battlefields":
+                            self._invalidate_battlefield_views(self.players[pos])
+                        elif zone_attr == "hands":
+                            self._note_hand_change(self.players[pos], card, False)
 
         card.zone = new_zone
         card.is_face_down = face_down
         card.controller = player
+        # Refresh the cached creature flag on every zone change: the SBA
+        # predicates then read one bool instead of lowering the type line
+        # per check.  Objects with __slots__ simply keep the string path.
+        type_line = getattr(card, "type_line", None)
+        try:
+            card._is_creature = isinstance(type_line, str) and type_line.lower().startswith("creature")
+        except (AttributeError, TypeError):
+            pass
+        self.version += 1
 
-        self.zones[player][new_zone].append(card)
+        getattr(self, attr)[idx].append(card)
+
+        if new_zone == "battlefield":
+            self.mark_dirty(card)
+            self._invalidate_battlefield_views(player)
+        elif new_zone == "hand":
+            self._note_hand_change(player, card, True)
 
         if new_zone == "battlefield" and self.trigger_engine:
             oracle = getattr(card, "oracle_text", "").lower()
@@ -168,26 +325,118 @@ class GameState:
     # ------------------------------------------------------------------
     # State based actions
     # ------------------------------------------------------------------
+    def begin_batch(self) -> None:
+        """Start deferring state-based action checks (nestable)."""
+        self._batch_depth += 1
+
+    def end_batch(self) -> List[str]:
+        """Close a batch; the outermost close runs the deferred SBA pass.
+
+        Board-wide effects mutate many objects in a row, and checking
+        state-based actions after each mutation walks every battlefield
+        for every target.  Batching amortizes that into a single pass.
+        """
+        if self._batch_depth > 0:
+            self._batch_depth -= 1
+        if self._batch_depth == 0:
+            return self.check_state_based_actions()
+        return []
+
+    @contextmanager
+    def batch(self):
+        """``with game_state.batch():`` form of begin/end_batch."""
+        self.begin_batch()
+        try:
+            yield self
+        finally:
+            self.end_batch()
+
+    def mark_dirty(self, obj: Any) -> None:
+        """Flag ``obj`` (permanent or player) for the next SBA check.
+
+        Mutators that change life, damage or toughness report the
+        affected object here so the periodic check only re-evaluates
+        what actually moved instead of sweeping every battlefield.
+        """
+        self._sba_dirty[id(obj)] = obj
+
     def check_state_based_actions(self) -> List[str]:
-        """Evaluate and apply all state-based action rules."""
+        """Evaluate and apply state-based action rules.
+
+        Normally only objects reported via :meth:`mark_dirty` are
+        re-evaluated; an exhaustive :meth:`check_all` sweep runs on the
+        first check of each turn to catch unreported mutations.  While a
+        batch is open the check is a no-op; the deferred pass runs once
+        when the outermost batch closes.
+        """
+        if self._batch_depth:
+            return []
+        if self._sba_full_scan:
+            self._sba_full_scan = False
+            self._sba_dirty.clear()
+            return self.check_all()
+        if not self._sba_dirty:
+            return []
+
+        dirty = self._sba_dirty
+        self._sba_dirty = {}
+        results: List[str] = []
+        for obj in dirty.values():
+            if obj in self._pidx:  # a player: life-total rules
+                for cond, act in self._sba_rules:
+                    if cond(obj):
+                        results.append(act(obj, None))
+                continue
+            controller = getattr(obj, "controller", None)
+            controller_idx = self._pidx.get(controller)
+            if controller_idx is None or obj not in self.battlefields[controller_idx]:
+                continue
+            for cond, act in self._sba_rules:
+                if cond(obj):
+                    results.append(act(obj, controller))
+        return results
+
+    def check_all(self) -> List[str]:
+        """Exhaustive SBA sweep over every player and permanent.
+
+        Runs column-style: each battlefield is walked exactly once, the
+        doomed creatures are collected, and destruction is applied after
+        the walk so the list being iterated is never mutated mid-scan.
+        The old form re-walked (and copied) every battlefield once per
+        rule and re-dispatched through the rule table per permanent.
+        """
         results: List[str] = []
-        for rule in self._sba_rules:
-            for player in list(self.players):
-                for permanent in list(self.get_zone(player, "battlefield")):
-                    if rule["condition"](permanent):
-                        results.append(rule["action"](permanent, player))
-                if rule["condition"](player):
-                    results.append(rule["action"](player, None))
+        creature_dead = self._creature_dead
+        for player in list(self.players):
+            doomed = [
+                permanent
+                for permanent in self.get_zone(player, "battlefield")
+                if creature_dead(permanent)
+            ]
+            for permanent in doomed:
+                results.append(self._destroy_creature(permanent, player))
+            if self._player_zero_life(player):
+                results.append(self._player_lose(player, None))
         return results
 
     # --- SBA rule helpers -------------------------------------------------
     @staticmethod
-    def _creature_with_zero_toughness(obj: Any) -> bool:
-        return getattr(obj, "type_line", "").lower().startswith("creature") and getattr(obj, "toughness", 1) <= 0
+    def _is_creature(obj: Any) -> bool:
+        """Read the cached creature flag, falling back to the type line."""
+        flag = getattr(obj, "_is_creature", None)
+        if flag is None:
+            flag = getattr(obj, "type_line", "").lower().startswith("creature")
+        return flag
 
     @staticmethod
-    def _creature_with_lethal_damage(obj: Any) -> bool:
-        return getattr(obj, "type_line", "").lower().startswith("creature") and getattr(obj, "damage", 0) >= getattr(obj, "toughness", 1)
+    def _creature_dead(obj: Any) -> bool:
+        """Zero-toughness and lethal-damage rules share the same action,
+        so they fold into one predicate with a single creature check and
+        a single toughness read."""
+        if not GameState._is_creature(obj):
+            return False
+        toughness = getattr(obj, "toughness", 1)
+        return toughness <= 0 or getattr(obj, "damage", 0) >= toughness
 
     def _destroy_creature(self, creature: Any, controller: Any) -> str:
         self.move_card(creature, controller, "graveyard")
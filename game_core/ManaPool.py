@@ -10,32 +10,105 @@ parse and spend mana costs including generic and hybrid notation such as
 from __future__ import annotations
 
 
-from typing import Dict, Iterable, List, Union
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple, Union
 import re
+import sys
+
+# Interned colour literals: every symbol that flows through parsing is
+# reduced to one of these six objects, so later dict hashes and compares
+# are effectively pointer operations.
+_COLORS = tuple(sys.intern(c) for c in ("W", "U", "B", "R", "G", "C"))
+_COLOR_SET = frozenset(_COLORS)
+_COLOR_INDEX = {c: i for i, c in enumerate(_COLORS)}
+
+_symbol_pattern = re.compile(r"{(.*?)}")
+
+
+@lru_cache(maxsize=4096)
+def _parse_cost_cached(mana_cost: str) -> Tuple[Tuple[int, ...], int, Tuple[Tuple[Union[str, int], ...], ...]]:
+    """Parse ``mana_cost`` into immutable components, memoized per string.
+
+    Returns ``(colours, generic, hybrids)`` where ``colours`` is a 6-int
+    tuple aligned with :data:`_COLORS`, ``generic`` is the generic mana
+    required and ``hybrids`` is a tuple of option tuples.  The same cost
+    strings recur constantly (each card's printed cost is queried on
+    every playability check), so after the first parse the regex scan
+    and per-symbol branching collapse into a cache lookup.
+    """
+    colours = [0] * len(_COLORS)
+    generic = 0
+    hybrids: List[Tuple[Union[str, int], ...]] = []
+
+    # Well-formed costs are back-to-back {X} tokens; slicing off the
+    # outer braces and splitting on "}{" runs entirely in C and skips
+    # the regex state machine.  Anything irregular falls back to the
+    # regex so malformed strings keep their old behaviour.
+    syms = None
+    if mana_cost.startswith("{") and mana_cost.endswith("}"):
+        parts = mana_cost[1:-1].split("}{")
+        if all("{" not in p and "}" not in p for p in parts):
+            syms = parts
+    if syms is None:
+        syms = _symbol_pattern.findall(mana_cost)
+
+    for sym in syms:
+        if sym.isdigit():
+            generic += int(sym)
+        elif "/" in sym:
+            opts: List[Union[str, int]] = []
+            for p in (p.strip() for p in sym.split("/")):
+                if p.isdigit():
+                    opts.append(int(p))
+                elif p in _COLOR_SET:
+                    opts.append(sys.intern(p))
+                else:
+                    raise ValueError(f"Unknown mana symbol: {sym}")
+            hybrids.append(tuple(opts))
+        elif sym in _COLOR_SET:
+            colours[_COLOR_INDEX[sym]] += 1
+        else:
+            raise ValueError(f"Unknown mana symbol: {sym}")
+    return tuple(colours), generic, tuple(hybrids)
+
+
+# (pool snapshot, cost string) -> payability, shared process-wide.  The
+# snapshot is part of the key, so mutations never need to invalidate;
+# stale states simply stop being asked about and age out on eviction.
+_CAN_PAY_CACHE: Dict[tuple, bool] = {}
+_CAN_PAY_CACHE_LIMIT = 2048
+
 
 class ManaPool:
-    COLORS = ("W", "U", "B", "R", "G", "C")
+    __slots__ = ("pool",)
+
+    COLORS = _COLORS
+    #: Colour symbol -> pool index; counts live in a flat 6-int list so
+    #: pool arithmetic is integer indexing and cloning is ``pool[:]``
+    #: instead of hashed dict lookups and dict copies.
+    _IDX = _COLOR_INDEX
 
     def __init__(self) -> None:
         """Container for a player's available mana."""
-        self.pool: Dict[str, int] = {c: 0 for c in self.COLORS}
+        self.pool: List[int] = [0] * len(self.COLORS)
 
     # ------------------------------------------------------------------
     # Basic operations
     # ------------------------------------------------------------------
     def add(self, color: str, amount: int = 1) -> None:
         """Add mana of ``color`` to the pool.
-   
+
         Raises
         ------
         ValueError
             If ``color`` is unknown or ``amount`` is negative.
         """
-        if color not in self.COLORS:
+        idx = self._IDX.get(color)
+        if idx is None:
             raise ValueError(f"Invalid mana colour: {color}")
         if amount < 0:
             raise ValueError("Cannot add a negative amount of mana")
-        self.pool[color] += amount
+        self.pool[idx] += amount
     def spend(self, color: str, amount: int = 1) -> None:
         """Remove mana of ``color`` from the pool.
 
@@ -44,13 +117,14 @@ class ManaPool:
         ValueError
             If ``color`` is unknown or the pool lacks enough mana.
         """
-        if color not in self.COLORS:
+        idx = self._IDX.get(color)
+        if idx is None:
             raise ValueError(f"Invalid mana colour: {color}")
         if amount < 0:
             raise ValueError("Cannot spend a negative amount of mana")
-        if self.pool[color] < amount:
+        if self.pool[idx] < amount:
             raise ValueError(f"Not enough {color} mana to spend")
-        self.pool[color] -= amount
+        self.pool[idx] -= amount
 
     def available(self, color: str | None = None) -> Union[int, Dict[str, int]]:
         """Return available mana.
@@ -59,27 +133,27 @@ class ManaPool:
         ----------
         color : str, optional
             When provided, returns the amount of that colour.  Otherwise a copy
-            of the entire pool is returned.
+            of the entire pool is returned as a colour-keyed dict.
         """
         if color is None:
-            return dict(self.pool)
-        if color not in self.COLORS:
+            return dict(zip(self.COLORS, self.pool))
+        idx = self._IDX.get(color)
+        if idx is None:
             raise ValueError(f"Invalid mana colour: {color}")
-        return self.pool[color]
+        return self.pool[idx]
 
     def reset(self) -> None:
         """Clear all mana from the pool."""
-        for c in self.COLORS:
-            self.pool[c] = 0
+        self.pool[:] = (0,) * len(self.COLORS)
 
     def total(self) -> int:
         """Return the total amount of mana in the pool."""
-        return sum(self.pool.values())
+        return sum(self.pool)
 
     # ------------------------------------------------------------------
     # Mana cost handling
     # ------------------------------------------------------------------
-    _symbol_pattern = re.compile(r"{(.*?)}")
+    _symbol_pattern = _symbol_pattern
 
     def parse_cost(self, mana_cost: str) -> tuple[Dict[str, int], int, List[List[Union[str, int]]]]:
         """Parse a mana cost string.
@@ -97,82 +171,108 @@ class ManaPool:
             generic mana required and ``hybrids`` is a list describing each
             hybrid symbol as a list of options.  Hybrid options are either a
             colour symbol or an integer representing generic mana.
+
+        The heavy lifting is memoized in :func:`_parse_cost_cached`; this
+        wrapper only expands the immutable cached form into the mutable
+        shape documented above.
         """
-        colours = {c: 0 for c in self.COLORS}
-        generic = 0
-        hybrids: List[List[Union[str, int]]] = []
-
-        for sym in self._symbol_pattern.findall(mana_cost):
-            if sym.isdigit():
-                generic += int(sym)
-            elif "/" in sym:
-                parts = [p.strip() for p in sym.split("/")]
-                opts: List[Union[str, int]] = []
-                for p in parts:
-                    if p.isdigit():
-                        opts.append(int(p))
-                    elif p in self.COLORS:
-                        opts.append(p)
-                    else:
-                        raise ValueError(f"Unknown mana symbol: {sym}")
-                hybrids.append(opts)
-            elif sym in self.COLORS:
-                colours[sym] += 1
-            else:
-                raise ValueError(f"Unknown mana symbol: {sym}")
-        return colours, generic, hybrids
+        colours_t, generic, hybrids_t = _parse_cost_cached(sys.intern(mana_cost))
+        return dict(zip(self.COLORS, colours_t)), generic, [list(h) for h in hybrids_t]
 
     # ------------------------------------------------------------------
     # Internal helper for paying hybrid/generic costs
     # ------------------------------------------------------------------
-    def _allocate(self, available: Dict[str, int], hybrids: List[List[Union[str, int]]],
-                  index: int, generic_needed: int, path: Dict[str, int]) -> Dict[str, int] | None:
-        if index == len(hybrids):
-            if sum(available.values()) < generic_needed:
-                return None
-            allocation = path.copy()
-            remaining = available.copy()
+    def _allocate(self, available: List[int], hybrids: List[List[Union[str, int]]],
+                  generic_needed: int) -> Dict[str, int] | None:
+        """Find an allocation paying the hybrid and generic parts of a cost.
+
+        The hybrid choice space is enumerated as a single mixed-radix
+        counter over ``range(product of option counts)`` instead of the
+        former recursive search: per candidate the working pool is a
+        preallocated 6-int list rewritten in place, with no dict copies
+        or call frames per node.  The first hybrid symbol is the most
+        significant digit, so candidates are tried in the same
+        left-to-right preference order the recursion used.  Returns the
+        colour -> amount allocation for the first feasible candidate,
+        or ``None``.
+        """
+        idx_map = self._IDX
+        total = 1
+        for h in hybrids:
+            total *= len(h)
+        nh = len(hybrids)
+        work = available[:]
+
+        for code in range(total):
+            work[:] = available
             need = generic_needed
-            for colour in self.COLORS:
-                if need == 0:
+            feasible = True
+            c = code
+            for i in range(nh - 1, -1, -1):
+                opts = hybrids[i]
+                opt = opts[c % len(opts)]
+                c //= len(opts)
+                if isinstance(opt, int):
+                    need += opt
+                elif work[idx := idx_map[opt]] > 0:
+                    work[idx] -= 1
+                else:
+                    feasible = False
                     break
-                use = min(remaining[colour], need)
-                if use:
-                    allocation[colour] = allocation.get(colour, 0) + use
-                    remaining[colour] -= use
+            if not feasible or sum(work) < need:
+                continue
+
+            # First feasible candidate wins: hybrid colour picks are the
+            # difference against the untouched pool, generic fills from
+            # whatever remains in WUBRGC order.
+            allocation: Dict[str, int] = {}
+            for idx, colour in enumerate(self.COLORS):
+                spent = available[idx] - work[idx]
+                if need and work[idx]:
+                    use = min(work[idx], need)
+                    spent += use
                     need -= use
-            return allocation if need == 0 else None
-
-        for opt in hybrids[index]:
-            if isinstance(opt, int):
-                res = self._allocate(available, hybrids, index + 1, generic_needed + opt, path)
-                if res:
-                    return res
-            else:
-                if available.get(opt, 0) > 0:
-                    avail_copy = available.copy()
-                    avail_copy[opt] -= 1
-                    new_path = path.copy()
-                    new_path[opt] = new_path.get(opt, 0) + 1
-                    res = self._allocate(avail_copy, hybrids, index + 1, generic_needed, new_path)
-                    if res:
-                        return res
+                if spent:
+                    allocation[colour] = spent
+            return allocation
         return None
 
     def can_pay(self, mana_cost: str) -> bool:
-        """Return ``True`` if the pool can satisfy ``mana_cost``."""
+        """Return ``True`` if the pool can satisfy ``mana_cost``.
+
+        Memoized per (pool snapshot, cost): search and priority loops
+        ask the same question many times against an unchanged pool, and
+        a hit skips the hybrid allocation search entirely.
+        """
+        key = (tuple(self.pool), sys.intern(mana_cost))
+        hit = _CAN_PAY_CACHE.get(key)
+        if hit is not None:
+            return hit
+        result = self._can_pay_uncached(key[1])
+        if len(_CAN_PAY_CACHE) >= _CAN_PAY_CACHE_LIMIT:
+            _CAN_PAY_CACHE.clear()
+        _CAN_PAY_CACHE[key] = result
+        return result
+
+    def _can_pay_uncached(self, mana_cost: str) -> bool:
         try:
-            colours, generic, hybrids = self.parse_cost(mana_cost)
+            colours, generic, hybrids = _parse_cost_cached(sys.intern(mana_cost))
         except ValueError:
             return False
 
-        available = self.pool.copy()
-        for colour, amount in colours.items():
-            if available[colour] < amount:
-                return False
-            available[colour] -= amount
+        available = self.pool[:]
+        for idx, amount in enumerate(colours):
+            if amount:
+                if available[idx] < amount:
+                    return False
+                available[idx] -= amount
 
-        allocation = self._allocate(available, hybrids, 0, generic, {})
+        # Most printed costs have no hybrid symbols; feasibility is then
+        # just a total-versus-generic compare, no solver needed.
+        if not hybrids:
+            return not generic or sum(available) >= generic
+
+        allocation = self._allocate(available, hybrids, generic)
         return allocation is not None
 
     def pay(self, mana_cost: str) -> None:
@@ -183,21 +283,42 @@ class ManaPool:
         ValueError
             If the pool does not contain enough mana.
         """
-        colours, generic, hybrids = self.parse_cost(mana_cost)
+        colours, generic, hybrids = _parse_cost_cached(sys.intern(mana_cost))
+
+        available = self.pool[:]
+        for idx, amount in enumerate(colours):
+            if amount:
+                if available[idx] < amount:
+                    raise ValueError("Insufficient mana in pool")
+                available[idx] -= amount
 
-        available = self.pool.copy()
-        for colour, amount in colours.items():
-            if available[colour] < amount:
+        # Hybrid-free costs (the common case) skip the solver: spend the
+        # fixed colours, then fill generic greedily in WUBRGC order —
+        # the same order the solver would have chosen.
+        if not hybrids:
+            if generic and sum(available) < generic:
                 raise ValueError("Insufficient mana in pool")
-            available[colour] -= amount
+            for colour, amount in zip(self.COLORS, colours):
+                if amount:
+                    self.spend(colour, amount)
+            need = generic
+            for idx, colour in enumerate(self.COLORS):
+                if not need:
+                    break
+                use = min(available[idx], need)
+                if use:
+                    self.spend(colour, use)
+                    need -= use
+            return
 
-        allocation = self._allocate(available, hybrids, 0, generic, {})
+        allocation = self._allocate(available, hybrids, generic)
         if allocation is None:
             raise ValueError("Insufficient mana in pool")
 
         # spend fixed colours
-        for colour, amount in colours.items():
-            self.spend(colour, amount)
+        for colour, amount in zip(self.COLORS, colours):
+            if amount:
+                self.spend(colour, amount)
         # spend hybrid/generic allocation
         for colour, amount in allocation.items():
             self.spend(colour, amount)
@@ -206,6 +327,6 @@ class ManaPool:
     # Representation helpers
     # ------------------------------------------------------------------
     def __str__(self) -> str:  # pragma: no cover - simple repr
-        return str(self.pool)
+        return str(dict(zip(self.COLORS, self.pool)))
 
     __repr__ = __str__
@@ -1,17 +1,65 @@
+import collections
+import logging
+
 from game_core.ManaPool import ManaPool
 from stack_system.StackEngine import Spell
 
+logger = logging.getLogger("mtg_engine")
+
+
+def _card_is_land(card):
+    """Read the flag cached at card construction, falling back to the
+    type-line test for plain stand-in objects used by tests."""
+    flag = getattr(card, "is_land", None)
+    if flag is None:
+        return "land" in card.type_line.lower()
+    return flag
+
+
+def _card_is_creature(card):
+    """Creature check mirroring :func:`_card_is_land`, preferring the
+    flags cached by Card construction or GameState.move_card."""
+    flag = getattr(card, "is_creature", None)
+    if flag is None:
+        flag = getattr(card, "_is_creature", None)
+    if flag is None:
+        type_line = getattr(card, "type_line", "")
+        return isinstance(type_line, str) and "creature" in type_line.lower()
+    return flag
+
+
 class Player:
     def __init__(self, name):
         self.name = name
         self.life = 20
         self.hand = []
-        self.library = []
+        # deque: draw is popleft, O(1) instead of pop(0)'s O(n) shift.
+        self.library = collections.deque()
+        # O(1) membership companion to ``hand``, keyed by id() because
+        # card objects need not be hashable.
+        self._hand_ids = set()
         self.graveyard = []
         self.exile = []
         self.battlefield = []
         self.mana_pool = ManaPool()
         self.lands_played_this_turn = 0
+        # Back-reference set by GameState.register_player so life
+        # mutations can report themselves to the SBA dirty set.
+        self.game_state = None
+        # Version counters invalidating the castable-spell cache: bumped
+        # by every hand or mana mutation that goes through this class.
+        self._hand_version = 0
+        self._mana_version = 0
+        self._castable = (-1, -1, [])
+        # Typed battlefield views so land/creature scans only touch the
+        # relevant permanents.  GameState.move_card invalidates them on
+        # every battlefield-touching move (a length compare alone misses
+        # equal-count remove+add sequences); the length check in
+        # _sync_battlefield_views remains as a safety net for code that
+        # appends to the battlefield list directly.
+        self.battlefield_lands = []
+        self.battlefield_creatures = []
+        self._bf_synced = -1
 
     def can_play_land(self):
         return self.lands_played_this_turn < 1
@@ -19,9 +67,16 @@ class Player:
     def play_land(self, card, game_state):
         if not self.can_play_land():
             return f"{self.name} has already played a land this turn."
-        if card not in self.hand:
+        # id-set fast accept; the linear scan only runs for cards that
+        # reached the hand without going through draw().
+        if id(card) not in self._hand_ids and card not in self.hand:
             return f"{card.name} is not in hand."
-        self.hand.remove(card)
+        try:
+            self.hand.remove(card)
+        except ValueError:
+            return f"{card.name} is not in hand."
+        self._hand_ids.discard(id(card))
+        self._hand_version += 1
         self.lands_played_this_turn += 1
         game_state.move_card(card, self, "battlefield")
         return f"{self.name} plays {card.name} as a land."
@@ -35,19 +90,28 @@ class Player:
             if not self.library:
                 self.lose("tried to draw from empty library")
                 return drawn
-            card = self.library.pop(0)
+            card = self.library.popleft()
             self.hand.append(card)
+            self._hand_ids.add(id(card))
             drawn.append(card)
-        print(f"{self.name} draws {len(drawn)} card(s): {[c.name for c in drawn]}")
+        if drawn:
+            self._hand_version += 1
+        # Guarded: the name-list comprehension only runs when the debug
+        # level is actually enabled.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s draws %s card(s): %s", self.name, len(drawn), [c.name for c in drawn])
         return drawn
 
     def gain_life(self, amount):
         self.life += amount
-        print(f"{self.name} gains {amount} life. (Total: {self.life})")
+        logger.debug("%s gains %s life. (Total: %s)", self.name, amount, self.life)
 
     def lose_life(self, amount):
         self.life -= amount
-        print(f"{self.name} loses {amount} life. (Total: {self.life})")
+        game_state = self.game_state
+        if game_state is not None:
+            game_state.mark_dirty(self)
+        logger.debug("%s loses %s life. (Total: %s)", self.name, amount, self.life)
 
     def untap_all(self):
         for permanent in self.battlefield:
@@ -60,49 +124,117 @@ class Player:
             discarded = self.hand[-excess:]
             self.graveyard.extend(discarded)
             self.hand = self.hand[:-excess]
+            for card in discarded:
+                self._hand_ids.discard(id(card))
+            self._hand_version += 1
             return discarded
         return []
 
     def lose(self, reason=""):
-        print(f"{self.name} loses the game. {reason}")
-        self.life = 0
+        logger.debug("%s loses the game. %s", self.name, reason)
+        # Only report an actual life change: lose() is also the SBA
+        # action for zero life, and re-marking an already-dead player
+        # would re-fire that rule on every subsequent check.
+        if self.life > 0:
+            self.life = 0
+            game_state = self.game_state
+            if game_state is not None:
+                game_state.mark_dirty(self)
+        else:
+            self.life = 0
 
     def add_mana(self, color, amount=1):
         self.mana_pool.add(color, amount)
+        self._mana_version += 1
 
     def reset_mana_pool(self):
         self.mana_pool.reset()
+        self._mana_version += 1
 
     def can_pay_cost(self, mana_cost):
         return self.mana_pool.can_pay(mana_cost)
 
     def pay_cost(self, mana_cost):
         self.mana_pool.pay(mana_cost)
+        self._mana_version += 1
 
     # === Dummy Player Automation Helpers ===
 
+    def _note_hand_gain(self, card):
+        """GameState.move_card hook: ``card`` was added to this hand."""
+        self._hand_ids.add(id(card))
+        self._hand_version += 1
+
+    def _note_hand_loss(self, card):
+        """GameState.move_card hook: ``card`` left this hand."""
+        self._hand_ids.discard(id(card))
+        self._hand_version += 1
+
+    def _invalidate_battlefield_views(self):
+        """Force a rebuild on the next land/creature scan.
+
+        Called by GameState.move_card whenever this player's battlefield
+        gains or loses a card.
+        """
+        self._bf_synced = -1
+
+    def _sync_battlefield_views(self):
+        if self._bf_synced != len(self.battlefield):
+            lands = self.battlefield_lands
+            creatures = self.battlefield_creatures
+            lands.clear()
+            creatures.clear()
+            for perm in self.battlefield:
+                if _card_is_land(perm):
+                    lands.append(perm)
+                if _card_is_creature(perm):
+                    creatures.append(perm)
+            self._bf_synced = len(self.battlefield)
+
     def has_untapped_lands(self):
-        return any(not p.tapped and "Land" in p.type_line for p in self.battlefield)
+        self._sync_battlefield_views()
+        return any(not p.tapped for p in self.battlefield_lands)
 
     def tap_land_for_mana(self):
-        for perm in self.battlefield:
-            if "Land" in perm.type_line and not perm.tapped:
+        self._sync_battlefield_views()
+        for perm in self.battlefield_lands:
+            if not perm.tapped:
                 perm.tapped = True
                 self.add_mana("U")
-                print(f"{self.name} taps {perm.name} for U mana.")
+                logger.debug("%s taps %s for U mana.", self.name, perm.name)
                 return True
         return False
 
+    def _castable_spells(self):
+        """Return the castable non-land cards in hand, cached per state.
+
+        The priority loop asks "can I cast anything?" repeatedly between
+        mutations; the list is recomputed only when the hand or mana
+        version counters have moved since the last scan.
+        """
+        key = (self._hand_version, self._mana_version)
+        if self._castable[:2] != key:
+            can_pay = self.can_pay_cost
+            castable = [
+                card for card in self.hand
+                if not _card_is_land(card) and can_pay(card.mana_cost)
+            ]
+            self._castable = (key[0], key[1], castable)
+        return self._castable[2]
+
     def can_cast_spell(self):
-        return any(card for card in self.hand if "land" not in card.type_line.lower() and self.can_pay_cost(card.mana_cost))
+        return bool(self._castable_spells())
 
     def cast_random_spell(self, game_state):
-        for card in self.hand:
-            if "land" not in card.type_line.lower() and self.can_pay_cost(card.mana_cost):
-                self.pay_cost(card.mana_cost)
-                spell = Spell(source=card, controller=self, effect_ir=getattr(card, "behavior_tree", {}))
-                game_state.stack.push(spell)
-                self.hand.remove(card)
-                print(f"{self.name} casts {card.name}.")
-                return True
-        return False
+        castable = self._castable_spells()
+        if not castable:
+            return False
+        card = castable[0]
+        self.pay_cost(card.mana_cost)
+        spell = Spell(source=card, controller=self, effect_ir=getattr(card, "behavior_tree", {}))
+        game_state.stack.push(spell)
+        self.hand.remove(card)
+        self._hand_ids.discard(id(card))
+        self._hand_version += 1
+        logger.debug("%s casts %s.", self.name, card.name)
+        return True
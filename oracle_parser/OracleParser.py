@@ -6,12 +6,39 @@ This parser converts raw Oracle text into a structured intermediate
 representation (IR) of effects without mutating any game state.
 """
 
+import sys
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
 from .Tokenizer import tokenize_clause, Tokenizer
 from .ClauseParser import parse_token_group, ClauseBlock
 
+# IR string values under these keys are compared against literals on every
+# effect resolution; interning them at parse time makes those equality
+# checks pointer-fast for the executor.
+_INTERN_KEYS = frozenset(("action", "type", "keyword", "reference_tag", "store_as"))
+
+
+def _intern_ir(node: Any) -> Any:
+    """Recursively intern dispatch-relevant strings in a parsed IR tree.
+
+    Condition strings are also lowercased here, once, so downstream
+    evaluation never needs a per-call ``.lower()``.
+    """
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if isinstance(value, str):
+                if key in _INTERN_KEYS:
+                    node[key] = sys.intern(value)
+                elif key == "condition":
+                    node[key] = sys.intern(value.lower())
+            else:
+                _intern_ir(value)
+    elif isinstance(node, list):
+        for child in node:
+            _intern_ir(child)
+    return node
+
 @dataclass
 class EffectIR:
     """Simplified effect representation returned by :class:`OracleParser`."""
@@ -51,7 +78,7 @@ class OracleParser:
             clause = parse_token_group(group)
             clause.source_index = idx
             ast = self.ast_compiler.compile(line)
-            ir = self.effect_parser.parse_ast(ast)
+            ir = _intern_ir(self.effect_parser.parse_ast(ast))
             clause.effect_ir = ir
             clause.trigger = ir.get("trigger")
             clause.condition = ir.get("condition")
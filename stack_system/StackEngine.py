@@ -48,6 +48,9 @@ class TriggeredAbility(StackObject):
 class StackEngine:
     def __init__(self):
         self._stack: List[StackObject] = []
+        # One engine per stack, reused across resolutions instead of
+        # constructed per stack object.
+        self.effect_engine = EffectEngine()
 
     def push(self, obj: StackObject):
         self._stack.append(obj)
@@ -75,15 +78,15 @@ class StackEngine:
         if obj is None:
             return
 
-        effect_engine = EffectEngine()
         context = EffectContext(
-            source_card=obj.source,
+            source=obj.source,
             controller=obj.controller,
             targets=[],
+            game_state=game_state,
         )
         # Execute and narrate; failures are swallowed to avoid halting the run
         try:
-            effect_engine.execute(obj.effect_ir, context, game_state)
+            self.effect_engine.execute(obj.effect_ir, context)
             narrator.log({"type": "stack_resolve", "label": obj.label(), "controller": getattr(obj.controller, "name", str(obj.controller))})
         except Exception as exc:
             narrator.log({"type": "stack_error", "label": obj.label(), "error": repr(exc)})
@@ -14,6 +14,7 @@ if REPO_ROOT not in sys.path:
 from game_core import Player, GameState
 from stack_system import StackEngine, TriggerEngine, Spell
 from effect_execution.EffectEngine import EffectContext, EffectEngine
+from CombatEngine import CombatEngine
 
 # Simulator is optional for headless runs; tests adapt if not present
 try:
@@ -106,5 +107,132 @@ class SmokeStackResolution(unittest.TestCase):
         ee.execute(dummy_effect_ir, ctx, state)
 
 
+class BattlefieldViewInvalidation(unittest.TestCase):
+    """Equal-count remove+add must not leave Player's typed views stale."""
+
+    class _Perm:
+        def __init__(self, name, type_line):
+            self.name = name
+            self.type_line = type_line
+            self.oracle_text = ""
+            self.tapped = False
+            self.zone = "battlefield"
+            self.controller = None
+
+    def test_equal_count_swap_refreshes_views(self):
+        p1, p2 = Player("Alice"), Player("Bob")
+        state = GameState(players=[p1, p2], stack=StackEngine(), trigger_engine=TriggerEngine())
+
+        land_a = self._Perm("Land A", "Basic Land")
+        land_b = self._Perm("Land B", "Basic Land")
+        for land in (land_a, land_b):
+            land.controller = p1
+            p1.battlefield.append(land)
+        self.assertTrue(p1.has_untapped_lands())
+        land_a.tapped = True
+
+        # One land leaves and a creature enters: the battlefield count is
+        # unchanged, so a pure length compare would keep the stale views.
+        state.move_card(land_b, p1, "graveyard")
+        bear = self._Perm("Bear", "Creature - Bear")
+        state.move_card(bear, p1, "battlefield")
+
+        self.assertFalse(p1.has_untapped_lands())
+        self.assertFalse(p1.tap_land_for_mana())
+        self.assertFalse(land_b.tapped)
+        self.assertEqual([c.name for c in p1.battlefield_lands], ["Land A"])
+        self.assertEqual([c.name for c in p1.battlefield_creatures], ["Bear"])
+
+
+class HandCacheInvalidation(unittest.TestCase):
+    """Zone moves touching the hand must refresh the castable cache."""
+
+    class _Card:
+        def __init__(self, name):
+            self.name = name
+            self.type_line = "Instant"
+            self.oracle_text = ""
+            self.mana_cost = "{U}"
+            self.zone = "hand"
+            self.controller = None
+
+    def test_move_out_of_hand_refreshes_castable_cache(self):
+        p1, p2 = Player("Alice"), Player("Bob")
+        state = GameState(players=[p1, p2], stack=StackEngine(), trigger_engine=TriggerEngine())
+
+        spell = self._Card("Counterspell")
+        spell.controller = p1
+        p1.hand.append(spell)
+        p1._note_hand_gain(spell)  # as draw() would record it
+        p1.add_mana("U")
+        self.assertTrue(p1.can_cast_spell())
+
+        state.move_card(spell, p1, "exile")
+        self.assertFalse(p1.can_cast_spell())
+        self.assertFalse(p1.cast_random_spell(state))
+        self.assertEqual(p1.mana_pool.available("U"), 1)  # nothing was paid
+
+    def test_move_into_hand_refreshes_castable_cache(self):
+        p1, p2 = Player("Alice"), Player("Bob")
+        state = GameState(players=[p1, p2], stack=StackEngine(), trigger_engine=TriggerEngine())
+        p1.add_mana("U")
+        self.assertFalse(p1.can_cast_spell())
+
+        spell = self._Card("Counterspell")
+        spell.controller = p1
+        spell.zone = "exile"
+        p1.exile.append(spell)
+        state.move_card(spell, p1, "hand")
+        self.assertTrue(p1.can_cast_spell())
+
+
+class CombatDamageStateBasedActions(unittest.TestCase):
+    """Lethal combat damage must be seen by SBA in the same phase."""
+
+    class _Creature:
+        def __init__(self, name, power, toughness):
+            self.name = name
+            self.type_line = f"Creature - {name}"
+            self.oracle_text = ""
+            self.power = power
+            self.toughness = toughness
+            self.damage = 0
+            self.combat_flags = 0
+            self.tapped = False
+            self.zone = "battlefield"
+            self.controller = None
+
+    def test_combat_kill_checked_same_phase(self):
+        p1, p2 = Player("Alice"), Player("Bob")
+        state = GameState(players=[p1, p2], stack=StackEngine(), trigger_engine=TriggerEngine())
+        state.check_state_based_actions()  # consume the turn's full scan
+
+        attacker = self._Creature("Ogre", 3, 3)
+        blocker = self._Creature("Bear", 2, 2)
+        attacker.controller, blocker.controller = p1, p2
+        p1.battlefield.append(attacker)
+        p2.battlefield.append(blocker)
+
+        engine = CombatEngine()
+        engine.attacker_ids.append(engine._register(attacker))
+        engine.defenders.append(p2)
+        engine.blockers_of.append([engine._register(blocker)])
+        engine.assign_combat_damage(state)
+
+        self.assertEqual(blocker.damage, 2)
+        state.check_state_based_actions()
+        self.assertIn(blocker, p2.graveyard)
+        self.assertIn(attacker, p1.battlefield)
+
+    def test_life_loss_checked_same_phase(self):
+        p1, p2 = Player("Alice"), Player("Bob")
+        state = GameState(players=[p1, p2], stack=StackEngine(), trigger_engine=TriggerEngine())
+        state.check_state_based_actions()  # consume the turn's full scan
+
+        p2.lose_life(25)
+        messages = state.check_state_based_actions()
+        self.assertTrue(any("loses the game" in m for m in messages))
+
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
\ No newline at end of file
@@ -7,7 +7,7 @@ from game_core.Player import Player
 from game_core.GameState import GameState
 from stack_system.StackEngine import StackEngine
 from stack_system.TriggerEngine import TriggerEngine
-from data_layer.CardEntities import Card, CardDataManager
+from data_layer.CardEntities import Card, shared_card_data_manager
 from effect_execution.EffectEngine import EffectEngine
 
 # Prefer root-level CombatEngine.py; fall back to package if present there.
@@ -29,13 +29,19 @@ class Simulator:
         self.game_state = GameState(players=self.players, stack=self.stack, trigger_engine=self.triggers)
         self.combat = CombatEngine()
         self.effect_engine = EffectEngine()
-        self.card_cache = CardDataManager()
+        # Share the global manager Card.__post_init__ reads: prefetching
+        # into a private instance warms a different cache file and the
+        # Card constructions below would still miss.
+        self.card_cache = shared_card_data_manager()
 
     def load_deck(self, player_index: int, deck_list: List[str]) -> None:
         """Very basic library loader using CardEntities.Card + CardDataManager."""
         player = self.players[player_index]
         player.library.clear()
 
+        # Warm the cache in bulk so the per-name lookups below are hits.
+        self.card_cache.prefetch(deck_list)
+
         for name in deck_list:
             data = self.card_cache.get_card_data(name)
 
@@ -79,6 +85,8 @@ class Simulator:
                     pass
 
             player.library.append(card)
+        # Persist any cache misses fetched above in one write.
+        self.card_cache.flush()
         # Shuffle intentionally omitted for determinism in smoke runs.
 
     def simulate_phase(self, phase: str) -> None: